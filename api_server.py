@@ -4,12 +4,24 @@ Tasmania Parliament Monitor - API Server
 Provides REST API for dashboard and external integrations
 """
 
-from flask import Flask, jsonify, request, send_file
+from flask import Flask, Response, request, send_file
 from flask_cors import CORS
+from cachetools import TTLCache
+import csv
+import hashlib
+import io
+import orjson
 import sqlite3
-import json
+import threading
+import uuid
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 import os
+import queue
+from contextlib import closing
+from functools import lru_cache, wraps
+from itertools import chain
 from pathlib import Path
 
 from monitor_config import (
@@ -21,9 +33,10 @@ from monitor_config import (
 
 # Import the parliament monitor for syncing operations
 try:
-    from parliament_monitor import ParliamentMonitor, refresh_runtime_config
+    from parliament_monitor import DatabaseManager, ParliamentMonitor, refresh_runtime_config
 except Exception:
     # Avoid import errors when the monitor is not yet initialised during tests
+    DatabaseManager = None
     ParliamentMonitor = None
     refresh_runtime_config = None
 
@@ -32,33 +45,216 @@ app = Flask(__name__)
 CORS(app)  # Enable CORS for dashboard access
 
 # Configuration
-config = load_monitor_config()
+config = load_monitor_config(copy=False)
 DB_PATH = config.get('database', {}).get('path', 'tasmania_parliament.db')
 
+# Idle SQLite connections kept warm between requests
+DB_POOL_SIZE = 25
+# Prepared statements retained per connection (sqlite3 default is 128)
+DB_STATEMENT_CACHE_SIZE = 512
+_db_pool = queue.LifoQueue(maxsize=DB_POOL_SIZE)
+
+# Serialized bodies of read-only endpoints, keyed by path and query string
+RESPONSE_CACHE_TTL = 30
+_response_cache = TTLCache(maxsize=256, ttl=RESPONSE_CACHE_TTL)
+_response_cache_lock = threading.Lock()
+
+# Serialises reloads when several request threads notice a config change
+_config_lock = threading.Lock()
+
+# Monitoring cycles run off the request thread; their state lives in the
+# database so any worker process can answer status polls
+_SYNC_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix='sync')
+
+
+def index_keywords():
+    """Flatten tracked keywords from config for the read endpoints"""
+    global _FLAT_KEYWORDS, _KEYWORD_COUNT, _KEYWORD_CATEGORIES
+    keywords = config.get('keywords', {}) or {}
+    _FLAT_KEYWORDS = [
+        {"keyword": word, "category": category}
+        for category, words in keywords.items()
+        for word in words
+    ]
+    _KEYWORD_COUNT = len(_FLAT_KEYWORDS)
+    _KEYWORD_CATEGORIES = list(keywords.keys())
+
+index_keywords()
+
 
 def reload_configuration():
     """Reload configuration from disk and refresh monitor cache."""
     global config, DB_PATH
-    config = load_monitor_config()
-    DB_PATH = config.get('database', {}).get('path', 'tasmania_parliament.db')
+    config = load_monitor_config(copy=False)
+    db_path = config.get('database', {}).get('path', 'tasmania_parliament.db')
+    if db_path != DB_PATH:
+        DB_PATH = db_path
+        close_db_pool()
+        upgrade_database()
+    index_keywords()
+    clear_response_cache()
+    _retire_monitor()
     if refresh_runtime_config:
         refresh_runtime_config()
 
+@app.before_request
+def refresh_configuration():
+    """Pick up config.json changes made through another worker process"""
+    # One stat() against load_config's cache; a new object means the file
+    # changed since this process last indexed it
+    if load_monitor_config(copy=False) is not config:
+        with _config_lock:
+            if load_monitor_config(copy=False) is not config:
+                reload_configuration()
+
+# Response helpers
+def jsonify(obj, status=200):
+    """Serialize a payload to a JSON response using orjson"""
+    return app.response_class(
+        orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS),
+        status=status,
+        mimetype='application/json'
+    )
+
+def read_json_body():
+    """Parse the request body with orjson, returning None when empty or invalid"""
+    raw = request.get_data(cache=False)
+    if not raw:
+        return None
+    try:
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        return None
+
+def cached_response(view):
+    """Serve repeat requests from the response cache until the TTL expires,
+    answering a matching If-None-Match with 304 Not Modified"""
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        key = (request.path, tuple(sorted(request.args.items(multi=True))))
+        with _response_cache_lock:
+            entry = _response_cache.get(key)
+        if entry is not None:
+            body, etag = entry
+            response = app.response_class(body, mimetype='application/json')
+        else:
+            response = app.make_response(view(*args, **kwargs))
+            if response.status_code != 200:
+                return response
+            body = response.get_data()
+            etag = hashlib.blake2s(body, digest_size=16).hexdigest()
+            with _response_cache_lock:
+                _response_cache[key] = (body, etag)
+
+        response.set_etag(etag)
+        return response.make_conditional(request)
+    return wrapper
+
+def clear_response_cache():
+    """Drop cached responses so the next request reads fresh data"""
+    with _response_cache_lock:
+        _response_cache.clear()
+
 # Database helper functions
-def get_db_connection():
-    """Create database connection"""
-    conn = sqlite3.connect(DB_PATH)
+class PooledConnection(sqlite3.Connection):
+    """SQLite connection that remembers which database file it was opened on"""
+    db_path = None
+
+def open_db_connection():
+    """Open a new read-only database connection tuned for the API workload"""
+    conn = sqlite3.connect(
+        Path(DB_PATH).absolute().as_uri() + '?mode=ro',
+        uri=True,
+        check_same_thread=False,
+        isolation_level=None,
+        cached_statements=DB_STATEMENT_CACHE_SIZE,
+        factory=PooledConnection
+    )
+    conn.db_path = DB_PATH
     conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA cache_size=-65536")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA mmap_size=268435456")
     return conn
 
+def get_db_connection():
+    """Take a pooled database connection, opening one if none are idle"""
+    while True:
+        try:
+            conn = _db_pool.get_nowait()
+        except queue.Empty:
+            return open_db_connection()
+        if conn.db_path == DB_PATH:
+            return conn
+        conn.close()
+
+def release_db_connection(conn):
+    """Return a connection to the pool, closing it when the pool is full or
+    the configured database has changed since it was opened"""
+    if conn.db_path != DB_PATH:
+        conn.close()
+        return
+    try:
+        _db_pool.put_nowait(conn)
+    except queue.Full:
+        conn.close()
+
+def close_db_pool():
+    """Close every idle pooled connection"""
+    while True:
+        try:
+            _db_pool.get_nowait().close()
+        except queue.Empty:
+            break
+
+def upgrade_database():
+    """Apply pending schema migrations and indexes to an existing database"""
+    if not os.path.exists(DB_PATH):
+        return
+    if DatabaseManager is not None:
+        DatabaseManager(DB_PATH).close()
+    # WAL persists in the file; read-only connections cannot switch it on
+    with closing(sqlite3.connect(DB_PATH)) as conn:
+        conn.execute("PRAGMA journal_mode=WAL")
+
 def query_db(query, args=(), one=False):
     """Execute database query"""
     conn = get_db_connection()
-    cursor = conn.execute(query, args)
-    result = cursor.fetchall()
-    conn.close()
+    try:
+        result = conn.execute(query, args).fetchall()
+    finally:
+        release_db_connection(conn)
     return (result[0] if result else None) if one else result
 
+def query_db_tuples(query, args=()):
+    """Execute database query, returning plain tuples in SELECT order"""
+    conn = get_db_connection()
+    try:
+        cursor = conn.cursor()
+        cursor.row_factory = None
+        return cursor.execute(query, args).fetchall()
+    finally:
+        release_db_connection(conn)
+
+def query_db_stream(query, args=()):
+    """Execute database query, returning an iterator of plain tuples read as it
+    is consumed and a callback that returns the connection to the pool.
+
+    The query runs and its first row is read before this returns, so errors
+    reach the caller instead of surfacing partway through a streamed response.
+    """
+    conn = get_db_connection()
+    try:
+        cursor = conn.cursor()
+        cursor.row_factory = None
+        cursor.execute(query, args)
+        first = cursor.fetchone()
+    except BaseException:
+        release_db_connection(conn)
+        raise
+    rows = chain((first,), cursor) if first is not None else iter(())
+    return rows, lambda: release_db_connection(conn)
+
 # API Routes
 
 @app.route('/')
@@ -74,68 +270,63 @@ def api_status():
     """API health check"""
     return jsonify({
         "status": "online",
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": datetime.now(),
         "database": os.path.exists(DB_PATH),
         "version": "1.0.0"
     })
 
 @app.route('/api/stats')
+@cached_response
 def api_stats():
     """Get dashboard statistics"""
     try:
-        # Documents today
+        # Documents today, active alerts by level, and members/committees
+        # being watched, gathered in a single round trip
         today = datetime.now().date()
-        docs_today = query_db(
-            "SELECT COUNT(*) as count FROM documents WHERE DATE(date_discovered) = ?",
+        counts = query_db(
+            """WITH
+                   today_docs AS (
+                       SELECT COUNT(*) as n FROM documents
+                       WHERE DATE(date_discovered) = ?
+                   ),
+                   active_alerts AS (
+                       SELECT IFNULL(alert_level, 'null') as alert_level, COUNT(*) as n
+                       FROM alerts
+                       WHERE sent = 0
+                       GROUP BY alert_level
+                   ),
+                   member_total AS (
+                       SELECT COUNT(*) as n FROM members
+                   ),
+                   committee_total AS (
+                       SELECT COUNT(*) as n FROM committees
+                       WHERE status IN ('active','inquiry')
+                   )
+               SELECT
+                   (SELECT n FROM today_docs) as new_today,
+                   (SELECT n FROM member_total) as members,
+                   (SELECT n FROM committee_total) as committees,
+                   (SELECT json_group_object(alert_level, n) FROM active_alerts) as alerts""",
             (today,), one=True
         )
-        
-        # Active alerts
-        alerts = query_db(
-            """SELECT alert_level, COUNT(*) as count 
-               FROM alerts 
-               WHERE sent = 0 
-               GROUP BY alert_level"""
-        )
-        
-        # Total watching
-        # Count keywords across all categories in config
-        keywords_cfg = config.get('keywords', {}) or {}
-        keywords_count = sum(len(words) for words in keywords_cfg.values())
+        alerts = orjson.loads(counts['alerts'])
 
-        # Count members from the database
-        members_count_row = query_db(
-            "SELECT COUNT(*) as count FROM members",
-            (),
-            one=True
-        )
-        members_count = members_count_row['count'] if members_count_row else 0
-
-        # Count committees (active or inquiry) from the database
-        committees_count_row = query_db(
-            "SELECT COUNT(*) as count FROM committees WHERE status IN ('active','inquiry')",
-            (),
-            one=True
-        )
-        committees_count = committees_count_row['count'] if committees_count_row else 0
 
         return jsonify({
-            "new_today": docs_today['count'] if docs_today else 0,
-            "active_alerts": {
-                alert['alert_level']: alert['count'] 
-                for alert in alerts
-            } if alerts else {},
-            "total_alerts": sum(alert['count'] for alert in alerts) if alerts else 0,
+            "new_today": counts['new_today'],
+            "active_alerts": alerts,
+            "total_alerts": sum(alerts.values()),
             "watching": {
-                "keywords": keywords_count,
-                "members": members_count,
-                "committees": committees_count
+                "keywords": _KEYWORD_COUNT,
+                "members": counts['members'],
+                "committees": counts['committees']
             }
         })
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
 @app.route('/api/documents')
+@cached_response
 def api_documents():
     """Get recent documents"""
     try:
@@ -147,7 +338,12 @@ def api_documents():
         days = request.args.get('days', 7, type=int)
         
         # Build query
-        query = "SELECT * FROM documents WHERE 1=1"
+        query = """
+            SELECT id, title, description, document_type, chamber,
+                   date_published, date_discovered, document_url, source_url,
+                   member, committee, portfolio, keywords_found, alert_level
+            FROM documents WHERE 1=1
+        """
         params = []
         
         if doc_type:
@@ -167,25 +363,27 @@ def api_documents():
         params.extend([limit, offset])
         
         # Execute query
-        documents = query_db(query, params)
+        documents = query_db_tuples(query, params)
         
         # Format response
         result = []
-        for doc in documents:
+        for (doc_id, title, description, doc_type, chamber, date_published,
+             date_discovered, document_url, source_url, member, committee,
+             portfolio, keywords_found, alert_level) in documents:
             result.append({
-                "id": doc['id'],
-                "title": doc['title'],
-                "description": doc['description'],
-                "type": doc['document_type'],
-                "chamber": doc['chamber'],
-                "date_published": doc['date_published'],
-                "date_discovered": doc['date_discovered'],
-                "url": doc['document_url'] or doc['source_url'],
-                "member": doc['member'],
-                "committee": doc['committee'],
-                "portfolio": doc['portfolio'],
-                "keywords": json.loads(doc['keywords_found'] or '[]'),
-                "alert_level": doc['alert_level']
+                "id": doc_id,
+                "title": title,
+                "description": description,
+                "type": doc_type,
+                "chamber": chamber,
+                "date_published": date_published,
+                "date_discovered": date_discovered,
+                "url": document_url or source_url,
+                "member": member,
+                "committee": committee,
+                "portfolio": portfolio,
+                "keywords": orjson.loads(keywords_found) if keywords_found else [],
+                "alert_level": alert_level
             })
         
         return jsonify({
@@ -198,6 +396,7 @@ def api_documents():
         return jsonify({"error": str(e)}), 500
 
 @app.route('/api/alerts')
+@cached_response
 def api_alerts():
     """Get active alerts"""
     try:
@@ -207,7 +406,9 @@ def api_alerts():
         
         # Build query
         query = """
-            SELECT a.*, d.title as doc_title, d.document_url, d.chamber
+            SELECT a.id, a.document_id, a.alert_level, a.title, a.description,
+                   a.keywords_matched, a.date_created, a.sent,
+                   d.title as doc_title, d.document_url, d.chamber
             FROM alerts a
             JOIN documents d ON a.document_id = d.id
             WHERE 1=1
@@ -225,42 +426,51 @@ def api_alerts():
         query += " ORDER BY a.date_created DESC LIMIT 100"
         
         # Execute query
-        alerts = query_db(query, params)
+        alerts = query_db_tuples(query, params)
         
-        # Format response
+        # Format response, tallying levels in the same pass
         result = []
-        for alert in alerts:
+        levels = Counter()
+        for (alert_id, document_id, alert_level, title, description,
+             keywords_matched, date_created, sent, doc_title, document_url,
+             chamber) in alerts:
+            levels[alert_level] += 1
             result.append({
-                "id": alert['id'],
-                "document_id": alert['document_id'],
-                "level": alert['alert_level'],
-                "title": alert['title'] or alert['doc_title'],
-                "description": alert['description'],
-                "keywords_matched": alert['keywords_matched'],
-                "date_created": alert['date_created'],
-                "sent": bool(alert['sent']),
-                "document_url": alert['document_url'],
-                "chamber": alert['chamber']
+                "id": alert_id,
+                "document_id": document_id,
+                "level": alert_level,
+                "title": title or doc_title,
+                "description": description,
+                "keywords_matched": keywords_matched,
+                "date_created": date_created,
+                "sent": bool(sent),
+                "document_url": document_url,
+                "chamber": chamber
             })
         
         return jsonify({
             "alerts": result,
             "count": len(result),
-            "critical": sum(1 for a in result if a['level'] == 'critical'),
-            "high": sum(1 for a in result if a['level'] == 'high'),
-            "standard": sum(1 for a in result if a['level'] == 'standard')
+            "critical": levels['critical'],
+            "high": levels['high'],
+            "standard": levels['standard']
         })
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
 @app.route('/api/feed')
+@cached_response
 def api_feed():
     """Get activity feed items"""
     try:
-        # Get recent documents with alerts
+        # Get recent documents with alerts; discovery times are stored as
+        # local time, so age them against local now
         query = """
             SELECT 
-                d.*,
+                d.id, d.title, d.description,
+                d.keywords_found, d.chamber, d.document_type, d.alert_level,
+                CAST((julianday('now', 'localtime') - julianday(d.date_discovered))
+                     * 86400 AS INTEGER) as age_sec,
                 a.alert_level as alert_priority
             FROM documents d
             LEFT JOIN alerts a ON d.id = a.document_id
@@ -268,35 +478,34 @@ def api_feed():
             LIMIT 20
         """
         
-        items = query_db(query)
+        items = query_db_tuples(query)
         
         # Format feed items
         feed = []
-        for item in items:
+        for (doc_id, title, description, keywords_found, chamber, doc_type,
+             alert_level, age_sec, alert_priority) in items:
             # Calculate time ago
-            discovered = datetime.fromisoformat(item['date_discovered'])
-            now = datetime.now()
-            diff = now - discovered
+            days, seconds = divmod(age_sec, 86400)
             
-            if diff.days == 0:
-                if diff.seconds < 3600:
-                    time_str = f"{diff.seconds // 60} minutes ago"
+            if days == 0:
+                if seconds < 3600:
+                    time_str = f"{seconds // 60} minutes ago"
                 else:
-                    time_str = f"{diff.seconds // 3600} hours ago"
-            elif diff.days == 1:
+                    time_str = f"{seconds // 3600} hours ago"
+            elif days == 1:
                 time_str = "Yesterday"
             else:
-                time_str = f"{diff.days} days ago"
+                time_str = f"{days} days ago"
             
             feed.append({
-                "id": item['id'],
-                "type": item['alert_level'] or 'standard',
-                "title": item['title'],
-                "description": item['description'] or 'No description available',
+                "id": doc_id,
+                "type": alert_level or 'standard',
+                "title": title,
+                "description": description or 'No description available',
                 "time": time_str,
-                "keywords": json.loads(item['keywords_found'] or '[]'),
-                "chamber": item['chamber'] or 'Unknown',
-                "document": f"{item['document_type']}-{item['id']}"
+                "keywords": orjson.loads(keywords_found) if keywords_found else [],
+                "chamber": chamber or 'Unknown',
+                "document": f"{doc_type}-{doc_id}"
             })
         
         return jsonify(feed)
@@ -304,26 +513,30 @@ def api_feed():
         return jsonify({"error": str(e)}), 500
 
 @app.route('/api/members')
+@cached_response
 def api_members():
     """Get parliament members"""
     try:
-        members = query_db(
-            """SELECT * FROM members 
+        members = query_db_tuples(
+            """SELECT id, name, role, party, chamber, electorate,
+                      portfolios, committees
+               FROM members 
                ORDER BY chamber, name
                LIMIT 100"""
         )
         
         result = []
-        for member in members:
+        for (member_id, name, role, party, chamber, electorate,
+             portfolios, committees) in members:
             result.append({
-                "id": member['id'],
-                "name": member['name'],
-                "role": member['role'],
-                "party": member['party'],
-                "chamber": member['chamber'],
-                "electorate": member['electorate'],
-                "portfolios": json.loads(member['portfolios'] or '[]'),
-                "committees": json.loads(member['committees'] or '[]')
+                "id": member_id,
+                "name": name,
+                "role": role,
+                "party": party,
+                "chamber": chamber,
+                "electorate": electorate,
+                "portfolios": orjson.loads(portfolios) if portfolios else [],
+                "committees": orjson.loads(committees) if committees else []
             })
         
         return jsonify({
@@ -334,63 +547,60 @@ def api_members():
         return jsonify({"error": str(e)}), 500
 
 @app.route('/api/committees')
+@cached_response
 def api_committees():
     """Get committees information"""
     try:
-        committees = query_db(
-            """SELECT * FROM committees 
+        committees = query_db_tuples(
+            """SELECT id, name, type, chamber, status, description,
+                      chair, members, current_inquiries
+               FROM committees 
                WHERE status IN ('active', 'inquiry')
                ORDER BY chamber, name"""
         )
         
         result = []
-        for committee in committees:
+        statuses = Counter()
+        for (committee_id, name, committee_type, chamber, status, description,
+             chair, members, current_inquiries) in committees:
+            statuses[status] += 1
             result.append({
-                "id": committee['id'],
-                "name": committee['name'],
-                "type": committee['type'],
-                "chamber": committee['chamber'],
-                "status": committee['status'],
-                "description": committee['description'],
-                "chair": committee['chair'],
-                "members": json.loads(committee['members'] or '[]'),
-                "inquiries": json.loads(committee['current_inquiries'] or '[]')
+                "id": committee_id,
+                "name": name,
+                "type": committee_type,
+                "chamber": chamber,
+                "status": status,
+                "description": description,
+                "chair": chair,
+                "members": orjson.loads(members) if members else [],
+                "inquiries": orjson.loads(current_inquiries) if current_inquiries else []
             })
         
         return jsonify({
             "committees": result,
             "count": len(result),
-            "active": sum(1 for c in result if c['status'] == 'active'),
-            "inquiries": sum(1 for c in result if c['status'] == 'inquiry')
+            "active": statuses['active'],
+            "inquiries": statuses['inquiry']
         })
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
 @app.route('/api/keywords')
+@cached_response
 def api_keywords():
     """Get tracked keywords"""
     try:
-        keywords = config.get('keywords', {})
-        
-        # Flatten keywords
-        all_keywords = []
-        for category, words in keywords.items():
-            for word in words:
-                all_keywords.append({
-                    "keyword": word,
-                    "category": category
-                })
-        
         return jsonify({
-            "keywords": all_keywords,
-            "categories": list(keywords.keys()),
-            "count": len(all_keywords)
+            "keywords": _FLAT_KEYWORDS,
+            "categories": _KEYWORD_CATEGORIES,
+            "count": _KEYWORD_COUNT
         })
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
 
 @app.route('/api/ui-model')
+@cached_response
 def api_ui_model():
     """Expose dashboard logic progression rules and section metadata."""
     try:
@@ -462,11 +672,14 @@ def api_ui_model():
 def api_add_keyword():
     """Add new keyword to tracking"""
     try:
-        data = request.json
+        data = read_json_body()
+        if not isinstance(data, dict):
+            return jsonify({"error": "JSON body required"}), 400
         keyword = data.get('keyword')
         category = data.get('category', 'custom')
         
-        if not keyword:
+        # A blank keyword would match every document
+        if not isinstance(keyword, str) or not keyword.strip():
             return jsonify({"error": "Keyword required"}), 400
         
         current_cfg = load_monitor_config()
@@ -497,8 +710,8 @@ def api_add_keyword():
 def api_delete_keyword():
     """Remove keyword from tracking"""
     try:
-        data = request.json
-        if not data:
+        data = read_json_body()
+        if not isinstance(data, dict):
             return jsonify({"error": "JSON body required"}), 400
         keyword = data.get('keyword')
         category = data.get('category')
@@ -527,21 +740,79 @@ def api_delete_keyword():
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
+@lru_cache(maxsize=None)
+def _get_monitor():
+    """Build the shared monitor on first use"""
+    return ParliamentMonitor()
+
+def _retire_monitor():
+    """Drop the cached monitor, closing it once syncs already queued on it finish"""
+    if _get_monitor.cache_info().currsize:
+        # The sync executor runs jobs in order on one thread, so the close
+        # waits behind any cycle still using the old monitor
+        _SYNC_EXECUTOR.submit(_get_monitor().close)
+    _get_monitor.cache_clear()
+
+def _run_sync(job_id):
+    """Run a monitoring cycle, recording the number of new documents on its job"""
+    try:
+        monitor = _get_monitor()
+        monitor.db.update_sync_job(job_id, 'running')
+        new_documents = len(monitor.run_monitoring_cycle())
+    except Exception as e:
+        # The monitor may never have been built, so record the failure on
+        # a connection of its own
+        with closing(DatabaseManager(DB_PATH)) as db:
+            db.update_sync_job(job_id, 'failed', error=str(e))
+    else:
+        monitor.db.update_sync_job(job_id, 'complete', result=new_documents)
+    finally:
+        clear_response_cache()
+
 @app.route('/api/sync', methods=['POST'])
 def api_sync():
-    """Trigger a monitoring cycle to fetch new documents"""
+    """Queue a monitoring cycle to fetch new documents"""
     try:
         if ParliamentMonitor is None:
             return jsonify({"error": "Monitoring service not available"}), 500
-        monitor = ParliamentMonitor()
-        new_docs = monitor.run_monitoring_cycle()
+        new_job_id = uuid.uuid4().hex
+        with closing(DatabaseManager(DB_PATH)) as db:
+            job_id, status = db.start_sync_job(new_job_id)
+        # A cycle already queued or running elsewhere is reported instead
+        if job_id == new_job_id:
+            _SYNC_EXECUTOR.submit(_run_sync, job_id)
         return jsonify({
             "success": True,
-            "new_documents": len(new_docs)
-        })
+            "job_id": job_id,
+            "status": status
+        }, status=202)
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
+@app.route('/api/sync/<job_id>')
+def api_sync_status(job_id):
+    """Report the progress of a queued monitoring cycle"""
+    try:
+        job = query_db(
+            "SELECT status, result, error FROM sync_jobs WHERE job_id = ?",
+            (job_id,), one=True
+        )
+    except sqlite3.Error as e:
+        return jsonify({"error": str(e)}), 500
+    if job is None:
+        return jsonify({"error": "Unknown sync job"}), 404
+
+    status = job['status']
+    if status == "failed":
+        return jsonify({"job_id": job_id, "status": status, "error": job['error']}), 500
+    if status != "complete":
+        return jsonify({"job_id": job_id, "status": status})
+    return jsonify({
+        "job_id": job_id,
+        "status": status,
+        "new_documents": job['result']
+    })
+
 @app.route('/api/search')
 def api_search():
     """Search documents"""
@@ -551,27 +822,50 @@ def api_search():
         if not query_text:
             return jsonify({"error": "Query required"}), 400
         
-        # Search in title, description, and content
-        documents = query_db(
-            """SELECT * FROM documents 
-               WHERE title LIKE ? 
-               OR description LIKE ? 
-               OR content_text LIKE ?
-               ORDER BY date_discovered DESC
-               LIMIT 50""",
-            (f'%{query_text}%', f'%{query_text}%', f'%{query_text}%')
-        )
+        # Search in title, description, and content through whichever index
+        # the database has: stemmed words, or substrings (trigrams) where the
+        # word index could not be built. Fall back to a LIKE scan when neither
+        # exists or the query is too short to index
+        phrase = '"' + query_text.replace('"', '""') + '"'
+        pat = f'%{query_text}%'
+        indexed_searches = [
+            # A prefix phrase, so partial words still find documents
+            ("JOIN documents_fts ON documents_fts.rowid = d.id WHERE documents_fts MATCH ?", (phrase + ' *',)),
+            ("JOIN documents_tri ON documents_tri.rowid = d.id WHERE documents_tri MATCH ?", (phrase,)),
+        ] if len(query_text) >= 3 else []
+        search_query = """SELECT d.id, d.title, d.description, d.document_type, d.chamber,
+                                 d.date_published, d.date_discovered, d.document_url, d.source_url
+                          FROM documents d
+                          {}
+                          ORDER BY d.date_discovered DESC
+                          LIMIT 50"""
+
+        for clause, params in indexed_searches:
+            try:
+                documents = query_db_tuples(search_query.format(clause), params)
+                break
+            except sqlite3.OperationalError:
+                # Index missing from this database
+                continue
+        else:
+            documents = query_db_tuples(
+                search_query.format(
+                    "WHERE d.title LIKE ? OR d.description LIKE ? OR d.content_text LIKE ?"
+                ),
+                (pat, pat, pat)
+            )
         
         result = []
-        for doc in documents:
+        for (doc_id, title, description, doc_type, chamber, date_published,
+             date_discovered, document_url, source_url) in documents:
             result.append({
-                "id": doc['id'],
-                "title": doc['title'],
-                "description": doc['description'],
-                "type": doc['document_type'],
-                "chamber": doc['chamber'],
-                "date": doc['date_published'] or doc['date_discovered'],
-                "url": doc['document_url'] or doc['source_url']
+                "id": doc_id,
+                "title": title,
+                "description": description,
+                "type": doc_type,
+                "chamber": chamber,
+                "date": date_published or date_discovered,
+                "url": document_url or source_url
             })
         
         return jsonify({
@@ -583,6 +877,7 @@ def api_search():
         return jsonify({"error": str(e)}), 500
 
 @app.route('/api/trends')
+@cached_response
 def api_trends():
     """Get keyword and document trends"""
     try:
@@ -600,25 +895,20 @@ def api_trends():
         
         daily_docs = query_db(query)
         
-        # Get keyword hits
+        # Get keyword hits from the normalised keyword table
         keyword_query = """
             SELECT 
-                keywords_found,
+                dk.keyword,
                 COUNT(*) as count
-            FROM documents
-            WHERE keywords_found IS NOT NULL 
-            AND keywords_found != '[]'
-            AND date_discovered >= date('now', '-30 days')
+            FROM document_keywords dk
+            JOIN documents d ON d.id = dk.document_id
+            WHERE d.date_discovered >= date('now', '-30 days')
+            GROUP BY dk.keyword
+            ORDER BY count DESC, dk.keyword
         """
         
         keyword_hits = query_db(keyword_query)
-        
-        # Process keyword data
-        keyword_counts = {}
-        for row in keyword_hits:
-            keywords = json.loads(row['keywords_found'] or '[]')
-            for kw in keywords:
-                keyword_counts[kw] = keyword_counts.get(kw, 0) + 1
+        keyword_counts = {row['keyword']: row['count'] for row in keyword_hits}
         
         # Format response
         dates = {}
@@ -632,7 +922,7 @@ def api_trends():
         return jsonify({
             "daily": dates,
             "keywords": keyword_counts,
-            "top_keywords": sorted(keyword_counts.items(), key=lambda x: x[1], reverse=True)[:10]
+            "top_keywords": [(row['keyword'], row['count']) for row in keyword_hits[:10]]
         })
     except Exception as e:
         return jsonify({"error": str(e)}), 500
@@ -646,63 +936,90 @@ def api_export():
         
         # Get data
         cutoff = datetime.now() - timedelta(days=days)
-        documents = query_db(
-            "SELECT * FROM documents WHERE date_discovered >= ? ORDER BY date_discovered DESC",
-            (cutoff,)
-        )
         
         if format_type == 'json':
+            documents = query_db_tuples(
+                """SELECT title, description, document_type, chamber,
+                          date_published, date_discovered, keywords_found,
+                          alert_level, document_url, source_url
+                   FROM documents
+                   WHERE date_discovered >= ?
+                   ORDER BY date_discovered DESC""",
+                (cutoff,)
+            )
+            
             result = []
-            for doc in documents:
+            for (title, description, doc_type, chamber, date_published,
+                 date_discovered, keywords_found, alert_level, document_url,
+                 source_url) in documents:
                 result.append({
-                    "title": doc['title'],
-                    "description": doc['description'],
-                    "type": doc['document_type'],
-                    "chamber": doc['chamber'],
-                    "date": doc['date_published'] or doc['date_discovered'],
-                    "keywords": json.loads(doc['keywords_found'] or '[]'),
-                    "alert_level": doc['alert_level'],
-                    "url": doc['document_url'] or doc['source_url']
+                    "title": title,
+                    "description": description,
+                    "type": doc_type,
+                    "chamber": chamber,
+                    "date": date_published or date_discovered,
+                    "keywords": orjson.loads(keywords_found) if keywords_found else [],
+                    "alert_level": alert_level,
+                    "url": document_url or source_url
                 })
             
             return jsonify({
-                "export_date": datetime.now().isoformat(),
+                "export_date": datetime.now(),
                 "days_included": days,
                 "document_count": len(result),
                 "documents": result
             })
         
         elif format_type == 'csv':
-            import csv
-            import io
-            
-            output = io.StringIO()
-            writer = csv.writer(output)
-            
-            # Write headers
-            writer.writerow([
-                'Title', 'Description', 'Type', 'Chamber', 
-                'Date', 'Keywords', 'Alert Level', 'URL'
-            ])
+            documents, release = query_db_stream(
+                """SELECT title, description, document_type, chamber,
+                          date_published, date_discovered, keywords_found,
+                          alert_level, document_url, source_url
+                   FROM documents
+                   WHERE date_discovered >= ?
+                   ORDER BY date_discovered DESC""",
+                (cutoff,)
+            )
             
-            # Write data
-            for doc in documents:
+            def generate():
+                """Yield the CSV one line at a time as rows are read"""
+                output = io.StringIO()
+                writer = csv.writer(output)
+                
+                def take_line():
+                    line = output.getvalue()
+                    output.seek(0)
+                    output.truncate(0)
+                    return line
+                
+                # Write headers
                 writer.writerow([
-                    doc['title'],
-                    doc['description'],
-                    doc['document_type'],
-                    doc['chamber'],
-                    doc['date_published'] or doc['date_discovered'],
-                    ', '.join(json.loads(doc['keywords_found'] or '[]')),
-                    doc['alert_level'],
-                    doc['document_url'] or doc['source_url']
+                    'Title', 'Description', 'Type', 'Chamber', 
+                    'Date', 'Keywords', 'Alert Level', 'URL'
                 ])
+                yield take_line()
+                
+                # Write data
+                for (title, description, doc_type, chamber, date_published,
+                     date_discovered, keywords_found, alert_level, document_url,
+                     source_url) in documents:
+                    writer.writerow([
+                        title,
+                        description,
+                        doc_type,
+                        chamber,
+                        date_published or date_discovered,
+                        ', '.join(orjson.loads(keywords_found) if keywords_found else []),
+                        alert_level,
+                        document_url or source_url
+                    ])
+                    yield take_line()
             
-            output.seek(0)
-            return output.getvalue(), 200, {
-                'Content-Type': 'text/csv',
+            response = Response(generate(), mimetype='text/csv', headers={
                 'Content-Disposition': f'attachment; filename=parliament_export_{datetime.now().strftime("%Y%m%d")}.csv'
-            }
+            })
+            response.call_on_close(release)
+            return response
         
         else:
             return jsonify({"error": "Invalid format. Use 'json' or 'csv'"}), 400
@@ -711,6 +1028,7 @@ def api_export():
         return jsonify({"error": str(e)}), 500
 
 @app.route('/api/report')
+@cached_response
 def api_report():
     """Generate summary report"""
     try:
@@ -724,65 +1042,55 @@ def api_report():
         else:
             cutoff = datetime.now() - timedelta(days=1)
         
-        # Get statistics
+        # Document, alert, type, chamber and keyword totals for the period,
+        # sharing one scan of the matching documents
+        counts = query_db(
+            """WITH
+                   scoped AS (
+                       SELECT id, document_type, chamber
+                       FROM documents
+                       WHERE date_discovered >= :cutoff
+                   ),
+                   by_type AS (
+                       SELECT IFNULL(document_type, 'null') as document_type, COUNT(*) as n
+                       FROM scoped
+                       GROUP BY document_type
+                   ),
+                   by_chamber AS (
+                       SELECT chamber, COUNT(*) as n
+                       FROM scoped
+                       WHERE chamber IS NOT NULL
+                       GROUP BY chamber
+                   ),
+                   top_keywords AS (
+                       SELECT dk.keyword, COUNT(*) as n
+                       FROM scoped s
+                       JOIN document_keywords dk ON dk.document_id = s.id
+                       GROUP BY dk.keyword
+                       ORDER BY n DESC, dk.keyword
+                       LIMIT 10
+                   )
+               SELECT
+                   (SELECT COUNT(*) FROM scoped) as documents,
+                   (SELECT COUNT(*) FROM alerts WHERE date_created >= :cutoff) as alerts,
+                   (SELECT json_group_object(document_type, n) FROM by_type) as by_type,
+                   (SELECT json_group_object(chamber, n) FROM by_chamber) as by_chamber,
+                   (SELECT json_group_array(json_array(keyword, n)) FROM top_keywords) as top_keywords""",
+            {"cutoff": cutoff}, one=True
+        )
+        top_keywords = orjson.loads(counts['top_keywords'])
+        top_keywords.sort(key=lambda kw: (-kw[1], kw[0]))
+
         stats = {
             "period": period,
-            "generated": datetime.now().isoformat(),
-            "documents": query_db(
-                "SELECT COUNT(*) as count FROM documents WHERE date_discovered >= ?",
-                (cutoff,), one=True
-            )['count'],
-            "alerts": query_db(
-                "SELECT COUNT(*) as count FROM alerts WHERE date_created >= ?",
-                (cutoff,), one=True
-            )['count'],
-            "by_type": {},
-            "by_chamber": {},
-            "top_keywords": []
+            "generated": datetime.now(),
+            "documents": counts['documents'],
+            "alerts": counts['alerts'],
+            "by_type": orjson.loads(counts['by_type']),
+            "by_chamber": orjson.loads(counts['by_chamber']),
+            "top_keywords": top_keywords
         }
         
-        # Documents by type
-        type_counts = query_db(
-            """SELECT document_type, COUNT(*) as count 
-               FROM documents 
-               WHERE date_discovered >= ?
-               GROUP BY document_type""",
-            (cutoff,)
-        )
-        for row in type_counts:
-            stats['by_type'][row['document_type']] = row['count']
-        
-        # Documents by chamber
-        chamber_counts = query_db(
-            """SELECT chamber, COUNT(*) as count 
-               FROM documents 
-               WHERE date_discovered >= ? AND chamber IS NOT NULL
-               GROUP BY chamber""",
-            (cutoff,)
-        )
-        for row in chamber_counts:
-            stats['by_chamber'][row['chamber']] = row['count']
-        
-        # Top keywords
-        keyword_data = query_db(
-            """SELECT keywords_found 
-               FROM documents 
-               WHERE date_discovered >= ? AND keywords_found IS NOT NULL""",
-            (cutoff,)
-        )
-        
-        keyword_counts = {}
-        for row in keyword_data:
-            keywords = json.loads(row['keywords_found'] or '[]')
-            for kw in keywords:
-                keyword_counts[kw] = keyword_counts.get(kw, 0) + 1
-        
-        stats['top_keywords'] = sorted(
-            keyword_counts.items(), 
-            key=lambda x: x[1], 
-            reverse=True
-        )[:10]
-        
         return jsonify(stats)
         
     except Exception as e:
@@ -804,10 +1112,20 @@ if __name__ == '__main__':
         print(f"Warning: Database '{DB_PATH}' not found.")
         print("Run 'python parliament_monitor.py --once' to initialize the database first.")
     
+    # Under gunicorn the master migrates once before forking (see
+    # gunicorn_conf.on_starting); the dev server is its own master
+    upgrade_database()
+    
     # Get port from config or use default
     port = config.get('api', {}).get('port', 5000)
     
-    print(f"Starting API server on http://localhost:{port}")
+    if os.environ.get('FLASK_ENV') != 'development':
+        print("The built-in Flask server is for development only.")
+        print("In production run: gunicorn -c gunicorn_conf.py api_server:app")
+        print("For local development set FLASK_ENV=development and re-run this script.")
+        raise SystemExit(1)
+    
+    print(f"Starting development API server on http://localhost:{port}")
     print(f"Dashboard available at http://localhost:{port}/")
     print(f"API documentation at http://localhost:{port}/api/status")
     
@@ -815,5 +1133,5 @@ if __name__ == '__main__':
     app.run(
         host='0.0.0.0',
         port=port,
-        debug=True  # Set to False in production
+        debug=True
     )
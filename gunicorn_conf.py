@@ -0,0 +1,31 @@
+"""Gunicorn settings for serving the Tasmania Parliament Monitor API.
+
+Run with: gunicorn -c gunicorn_conf.py api_server:app
+"""
+import multiprocessing
+import os
+
+from monitor_config import load_config
+
+# Listen on the same port the development server uses
+bind = f"0.0.0.0:{load_config(copy=False).get('api', {}).get('port', 5000)}"
+
+# Each worker imports api_server separately and keeps its own warm
+# SQLite connection pool. Requests block in sqlite3 and monitor cycles
+# parse PDFs in C, which green threads cannot yield around, so workers
+# use real threads; a few processes are plenty for a dashboard
+workers = min(multiprocessing.cpu_count(), 4)
+worker_class = "gthread"
+threads = 4
+keepalive = 5
+
+
+def on_starting(server):
+    """Upgrade an existing database once, before any worker forks"""
+    # Workers migrating at import time queue on SQLite's write lock, and a
+    # long backfill outlasts their busy timeout so they fail to boot
+    from parliament_monitor import DatabaseManager
+
+    db_path = load_config(copy=False).get('database', {}).get('path', 'tasmania_parliament.db')
+    if os.path.exists(db_path):
+        DatabaseManager(db_path).close()
@@ -4,10 +4,29 @@ from __future__ import annotations
 import json
 from copy import deepcopy
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
+
+try:
+    import orjson
+except ImportError:
+    # Fall back to the standard library when orjson is not installed
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    # Optional: large files are then parsed in one go like small ones
+    ijson = None
 
 CONFIG_PATH = Path("config.json")
 
+# Files above this size are merged section by section as they are parsed
+STREAM_PARSE_THRESHOLD = 1024 * 1024
+
+# Merged configuration per file, keyed by absolute path and tagged with
+# the (mtime_ns, size) it was read at
+_CACHE: Dict[Path, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
 DEFAULT_CONFIG: Dict[str, Any] = {
     "database": {
         "path": "tasmania_parliament.db"
@@ -111,34 +130,75 @@ DEFAULT_CONFIG: Dict[str, Any] = {
 
 
 def merge_dict(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
-    """Recursively merge two dictionaries without mutating inputs."""
-    result = deepcopy(base)
+    """Recursively merge two dictionaries without mutating inputs.
+
+    Only the dictionaries along overridden paths are copied; untouched
+    subtrees are shared with ``base`` and ``override``, so callers that
+    modify the result must deepcopy it first.
+    """
+    result = dict(base)
     for key, value in override.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = merge_dict(result[key], value)
+        current = result.get(key)
+        if isinstance(current, dict) and isinstance(value, dict):
+            result[key] = merge_dict(current, value)
         else:
-            result[key] = deepcopy(value)
+            result[key] = value
     return result
 
 
-def load_config(path: Path | str = CONFIG_PATH) -> Dict[str, Any]:
-    """Load configuration from disk, creating defaults if necessary."""
+def _load_streaming(config_path: Path) -> Dict[str, Any]:
+    """Parse a large config file one top-level section at a time, merging as it goes."""
+    merged = deepcopy(DEFAULT_CONFIG)
+    with config_path.open("rb") as fh:
+        for key, value in ijson.kvitems(fh, "", use_float=True):
+            current = merged.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                merged[key] = merge_dict(current, value)
+            else:
+                merged[key] = value
+    return merged
+
+
+def load_config(path: Path | str = CONFIG_PATH, copy: bool = True) -> Dict[str, Any]:
+    """Load configuration from disk, creating defaults if necessary.
+
+    Returns a private copy that is safe to modify. Read-only callers may
+    pass ``copy=False`` to get the cached result, which is reused until the
+    file's modification time or size changes and never aliases
+    ``DEFAULT_CONFIG``.
+    """
     config_path = Path(path)
-    if not config_path.exists():
+    cache_key = config_path.absolute()
+    try:
+        stat = config_path.stat()
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cached = _CACHE.get(cache_key)
+        if cached is not None and cached[0] == signature:
+            return deepcopy(cached[1]) if copy else cached[1]
+
+        if ijson is not None and stat.st_size > STREAM_PARSE_THRESHOLD:
+            merged = _load_streaming(config_path)
+        else:
+            raw = config_path.read_bytes()
+            data = orjson.loads(raw) if orjson else json.loads(raw)
+            merged = merge_dict(deepcopy(DEFAULT_CONFIG), data)
+    except FileNotFoundError:
         save_config(DEFAULT_CONFIG, config_path)
         return deepcopy(DEFAULT_CONFIG)
 
-    with config_path.open("r", encoding="utf-8") as fh:
-        data = json.load(fh)
-
-    merged = merge_dict(DEFAULT_CONFIG, data)
-    return merged
+    _CACHE[cache_key] = (signature, merged)
+    return deepcopy(merged) if copy else merged
 
 
 def save_config(config: Dict[str, Any], path: Path | str = CONFIG_PATH) -> None:
     """Persist configuration to disk."""
     config_path = Path(path)
-    config_path.write_text(json.dumps(config, indent=2, sort_keys=True), encoding="utf-8")
+    _CACHE.pop(config_path.absolute(), None)
+    if orjson:
+        payload = orjson.dumps(config, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+    else:
+        payload = json.dumps(config, indent=2, sort_keys=True).encode("utf-8")
+    config_path.write_bytes(payload)
 
 
 def get_dashboard_logic(config: Dict[str, Any] | None = None) -> Dict[str, Any]:
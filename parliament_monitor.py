@@ -4,47 +4,190 @@ Tasmania Parliament Monitor - Backend Service
 Monitors Tasmania Parliament website for new documents and updates
 """
 
+import asyncio
 import json
 import hashlib
 import logging
+import random
 import sqlite3
 import smtplib
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from email.mime.text import MIMEText
+from html import escape
 from email.mime.multipart import MIMEMultipart
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from types import MappingProxyType
+from typing import BinaryIO, Dict, Iterator, List, Optional, Set, Tuple
 import re
+import tempfile
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass, asdict
 from enum import Enum
-from copy import deepcopy
+from functools import lru_cache
 
 from monitor_config import load_config
 
 # Note: In production, install these packages:
-# pip install requests beautifulsoup4 pdfplumber schedule
+# pip install requests beautifulsoup4 pdfplumber
 
 try:
     import requests
-    from bs4 import BeautifulSoup
+    from bs4 import BeautifulSoup, SoupStrainer
     import pdfplumber
-    import schedule
 except ImportError:
-    print("Please install required packages: pip install requests beautifulsoup4 pdfplumber schedule")
+    print("Please install required packages: pip install requests beautifulsoup4 pdfplumber")
+
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    # Pure-Python parser; same results, just slower
+    HTML_PARSER = 'html.parser'
+
+try:
+    import ahocorasick
+except ImportError:
+    # Optional speedup; matching falls back to one substring test per keyword
+    ahocorasick = None
+
+try:
+    import orjson
+except ImportError:
+    # Fall back to the standard library when orjson is not installed
+    orjson = None
+
+try:
+    # selectolax 1.0 dropped the Modest backend; Lexbor is the one parser left
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+except ImportError:
+    # Optional speedup; tabled paper listings are parsed with BeautifulSoup
+    HTMLParser = None
+
+
+# Patterns used while scraping listing pages
+_PAPER_CLASS_RE = re.compile(r'(paper|document|tabled)', re.I)
+_TITLE_CLASS_RE = re.compile(r'title', re.I)
+_BILL_CLASS_RE = re.compile(r'bill', re.I)
+_COMMITTEE_CLASS_RE = re.compile(r'committee', re.I)
+_DATE_RE = re.compile(r'\d{1,2}[\s/]\w+[\s/]\d{4}')
+_READING_RE = re.compile(r'(first|second|third) reading|royal assent', re.I)
+_INQUIRY_RE = re.compile(r'inquiry|submission', re.I)
+
+# Only listing blocks are built into the tree when parsing each page type
+_PAPER_TAGS = ('tr', 'div', 'li')
+_PAPER_STRAINER = SoupStrainer(list(_PAPER_TAGS), class_=_PAPER_CLASS_RE)
+_BILL_STRAINER = SoupStrainer(['tr', 'div'], class_=_BILL_CLASS_RE)
+_COMMITTEE_STRAINER = SoupStrainer(['div', 'section'], class_=_COMMITTEE_CLASS_RE)
+
+
+def _iter_paper_listings(html: str):
+    """Yield (title, href, date text) for each paper listing on a tabled papers page,
+    where the date text is the first text node in the row that contains a date"""
+    if HTMLParser is not None:
+        # css('tr, div, li') groups matches by selector; walk the tree
+        # instead so rows come out in document order, as with BeautifulSoup
+        for paper in HTMLParser(html).root.traverse():
+            if paper.tag not in _PAPER_TAGS:
+                continue
+            if not _PAPER_CLASS_RE.search(paper.attributes.get('class') or ''):
+                continue
+            title_elem = next(
+                (node for node in paper.css('a, span')
+                 if _TITLE_CLASS_RE.search(node.attributes.get('class') or '')),
+                None
+            ) or paper.css_first('a')
+            if title_elem is None:
+                continue
+            href = title_elem.attributes.get('href') if title_elem.tag == 'a' else None
+            date_text = next(
+                (node.text_content for node in paper.traverse(include_text=True)
+                 if node.tag == '-text' and _DATE_RE.search(node.text_content)),
+                None
+            )
+            yield title_elem.text(strip=True), href, date_text
+        return
+
+    soup = BeautifulSoup(html, HTML_PARSER, parse_only=_PAPER_STRAINER)
+    for paper in soup.find_all(_PAPER_TAGS, class_=_PAPER_CLASS_RE):
+        title_elem = paper.find(['a', 'span'], class_=_TITLE_CLASS_RE) or paper.find('a')
+        if not title_elem:
+            continue
+        href = title_elem.get('href') if title_elem.name == 'a' else None
+        date_text = paper.find(string=_DATE_RE)
+        yield title_elem.get_text(strip=True), href, date_text and str(date_text)
+
+
+@lru_cache(maxsize=1024)
+def _parse_date(text: str) -> Optional[datetime]:
+    """Parse a '12 March 2025' style date, reusing results for repeated dates"""
+    try:
+        return datetime.strptime(text, '%d %B %Y')
+    except ValueError:
+        return None
+
+
+def _fingerprint(text: str) -> str:
+    """Return a short, fast dedupe key for scraped document metadata"""
+    return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+
+
+@lru_cache(maxsize=16)
+def _build_automaton(words: frozenset):
+    """Build an Aho-Corasick automaton, shared by every config load with the same keywords"""
+    automaton = ahocorasick.Automaton()
+    for word in words:
+        automaton.add_word(word, word)
+    automaton.make_automaton()
+    return automaton
+
+
+class KeywordMatcher:
+    """Case-insensitive substring matcher for a fixed list of keywords.
+
+    Blank keywords are ignored; they would otherwise match every document.
+    """
+
+    def __init__(self, keywords: List[str]):
+        self.keywords = tuple(keyword for keyword in keywords if keyword.strip())
+        # (keyword, lowercased keyword) pairs, lowered once per config load
+        self._pairs = tuple((keyword, keyword.lower()) for keyword in self.keywords)
+        self._lowered = tuple(lowered for _, lowered in self._pairs)
+        self._automaton = None
+        if ahocorasick is not None and self._lowered:
+            self._automaton = _build_automaton(frozenset(self._lowered))
+
+    def find(self, text_lower: str) -> List[str]:
+        """Return the keywords found in lowercased text, in list order"""
+        if self._automaton is None:
+            return [kw for kw, lowered in self._pairs if lowered in text_lower]
+
+        # One pass over the text reports every (possibly overlapping) match
+        present = {match for _, match in self._automaton.iter(text_lower)}
+        return [kw for kw, lowered in self._pairs if lowered in present]
+
+    def search(self, text_lower: str) -> bool:
+        """Return True if any keyword occurs in lowercased text"""
+        if self._automaton is None:
+            return any(lowered in text_lower for lowered in self._lowered)
+        return next(self._automaton.iter(text_lower), None) is not None
 
 # Configuration
 class Config:
     """Runtime configuration settings for the parliament monitor."""
 
     def __init__(self, data: Dict[str, any]):
-        self.raw = deepcopy(data)
+        # Frozen as JSON; the config is read-only at runtime, so a mutable
+        # copy is only decoded when someone asks for one
+        self._raw_json = orjson.dumps(data) if orjson else json.dumps(data)
 
         db_cfg = data.get("database", {})
         self.DB_PATH = db_cfg.get("path", "tasmania_parliament.db")
 
         source_cfg = data.get("sources", {}).get("urls", {})
-        self.URLS = deepcopy(source_cfg)
+        self.URLS = MappingProxyType(dict(source_cfg))
 
         scraping_cfg = data.get("scraping", {})
         self.REQUEST_TIMEOUT = scraping_cfg.get("timeout", 30)
@@ -73,7 +216,7 @@ class Config:
 
         keyword_cfg = data.get("keywords", {})
         self.KEYWORDS_BY_CATEGORY = {
-            category: sorted(set(words)) for category, words in keyword_cfg.items()
+            category: tuple(sorted(set(words))) for category, words in keyword_cfg.items()
         }
         # Maintain backwards compatibility for existing logic
         self.ALERT_KEYWORDS = sorted(
@@ -84,17 +227,26 @@ class Config:
         self.CRITICAL_KEYWORDS = alerts_cfg.get("critical_keywords", [])
         self.HIGH_PRIORITY_SOURCES = alerts_cfg.get("high_priority_sources", [])
 
+        self.ALERT_MATCHER = KeywordMatcher(self.ALERT_KEYWORDS)
+        self.CRITICAL_MATCHER = KeywordMatcher(self.CRITICAL_KEYWORDS)
+        self.SOURCE_MATCHER = KeywordMatcher(self.HIGH_PRIORITY_SOURCES)
+
         dashboard_cfg = data.get("dashboard", {})
         self.DASHBOARD_REFRESH_SECONDS = dashboard_cfg.get("refresh_interval_seconds", 120)
 
+    @property
+    def raw(self) -> Dict[str, any]:
+        """Return a fresh copy of the raw configuration dictionary."""
+        return orjson.loads(self._raw_json) if orjson else json.loads(self._raw_json)
+
     def to_dict(self) -> Dict[str, any]:
         """Return the raw configuration dictionary."""
-        return deepcopy(self.raw)
+        return self.raw
 
 
 def load_runtime_config() -> Config:
     """Load the runtime configuration from disk."""
-    return Config(load_config())
+    return Config(load_config(copy=False))
 
 
 RUNTIME_CONFIG = load_runtime_config()
@@ -126,7 +278,12 @@ class DocumentType(Enum):
     OTHER = "other"
 
 
-@dataclass
+# Enum members by stored value, skipping EnumMeta.__call__ for every row read
+_ALERT_LEVEL_BY_VALUE = {level.value: level for level in AlertLevel}
+_DOC_TYPE_BY_VALUE = {doc_type.value: doc_type for doc_type in DocumentType}
+
+
+@dataclass(slots=True)
 class Document:
     """Represents a parliamentary document"""
     id: Optional[int] = None
@@ -154,16 +311,136 @@ class Document:
             self.keywords_found = []
 
 
+@dataclass(slots=True)
+class Alert:
+    """Alert raised for a newly discovered document"""
+    document_id: Optional[int]
+    alert_level: str
+    title: str
+    description: Optional[str]
+    keywords_matched: str
+    date_created: datetime
+    chamber: Optional[str]
+    document_type: str
+    url: str
+
+
+class PageCache:
+    """Conditional GET validators for listing pages over one monitoring cycle"""
+
+    def __init__(self, stored: Dict[str, Tuple[Optional[str], Optional[str], str]]):
+        self.stored = stored
+        # Validators seen this cycle; only persisted once the cycle's
+        # documents are saved, so a failed cycle refetches everything
+        self._fresh: Dict[str, Tuple[Optional[str], Optional[str], str]] = {}
+        self._lock = threading.Lock()
+
+    def request_headers(self, url: str) -> Dict[str, str]:
+        """Return If-None-Match / If-Modified-Since headers for a URL"""
+        etag, last_modified, _ = self.stored.get(url, (None, None, None))
+        headers = {}
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+        return headers
+
+    def is_unchanged(self, url: str, body_hash: str) -> bool:
+        """Return True if a body matches the one stored for its URL"""
+        stored = self.stored.get(url)
+        return stored is not None and stored[2] == body_hash
+
+    def record(self, url: str, etag: Optional[str], last_modified: Optional[str], body_hash: str):
+        """Remember the validators of a freshly fetched page"""
+        with self._lock:
+            self._fresh[url] = (etag, last_modified, body_hash)
+
+    def fresh_entries(self) -> Dict[str, Tuple[Optional[str], Optional[str], str]]:
+        """Return the validators recorded this cycle"""
+        with self._lock:
+            return dict(self._fresh)
+
+
 class DatabaseManager:
     """Manages SQLite database operations"""
+
+    # Index name -> indexed table and columns (optionally partial)
+    INDEXES = {
+        'idx_docs_date': 'documents(date_discovered DESC)',
+        'idx_docs_type_date': 'documents(document_type, date_discovered DESC)',
+        'idx_docs_chamber_date': 'documents(chamber, date_discovered DESC)',
+        'idx_alerts_sent_level': 'alerts(sent, alert_level)',
+        'idx_alerts_sent_date': 'alerts(sent, date_created DESC)',
+        'idx_alerts_doc': 'alerts(document_id)',
+        'idx_docs_processed': 'documents(processed) WHERE processed = FALSE',
+        'idx_docs_alert_level': 'documents(alert_level)',
+    }
+    
+    # Bumped whenever stored data needs rewriting; see _migrate()
+    SCHEMA_VERSION = 1
+
+    # Stays under SQLite's default limit on bound parameters per statement
+    MAX_SQL_VARIABLES = 900
+
+    # Rows fetched per lock acquisition when streaming results
+    FETCH_BATCH_SIZE = 500
+
+    # Finished sync jobs are kept this long for late status polls
+    SYNC_JOB_RETENTION = timedelta(days=1)
+
+    # A sync job still active after this long died with its worker
+    SYNC_JOB_TIMEOUT = timedelta(hours=1)
+
+    # Column order shared by the single and batched document inserts
+    INSERT_DOCUMENT = '''
+        INSERT OR IGNORE INTO documents (
+            source_url, document_url, title, description,
+            document_type, chamber, date_published, date_discovered,
+            member, committee, portfolio, file_hash, content_text,
+            keywords_found, alert_level, processed
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    '''
     
     def __init__(self, db_path: str):
         self.db_path = db_path
+        # One long-lived connection in autocommit mode; batches open their
+        # own transaction through transaction()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        self.conn.row_factory = sqlite3.Row
+        # Serialises use of the shared connection across threads so one
+        # thread's statements never land inside another's transaction
+        self.lock = threading.RLock()
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        # Keep sort/temp b-trees in RAM, allow a 64 MB page cache and read
+        # through a memory map instead of copying pages via read()
+        self.conn.execute('PRAGMA temp_store=MEMORY')
+        self.conn.execute('PRAGMA cache_size=-65536')
+        self.conn.execute('PRAGMA mmap_size=268435456')
         self.init_database()
+
+    def close(self):
+        """Close the database connection"""
+        self.conn.close()
+
+    @contextmanager
+    def transaction(self):
+        """Run the enclosed statements as a single transaction"""
+        with self.lock:
+            # Take the write lock up front: a deferred BEGIN that reads first
+            # cannot upgrade once another connection has committed, and
+            # fails with "database is locked" without waiting
+            self.conn.execute('BEGIN IMMEDIATE')
+            try:
+                yield self.conn
+            except BaseException:
+                self.conn.execute('ROLLBACK')
+                raise
+            self.conn.execute('COMMIT')
     
     def init_database(self):
         """Initialize database tables"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self.transaction() as conn:
             conn.execute('''
                 CREATE TABLE IF NOT EXISTS documents (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -240,140 +517,578 @@ class DatabaseManager:
                     timestamp TIMESTAMP
                 )
             ''')
+            
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS url_cache (
+                    url TEXT PRIMARY KEY,
+                    etag TEXT,
+                    last_modified TEXT,
+                    body_hash TEXT,
+                    fetched_at TIMESTAMP
+                )
+            ''')
+            
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS sync_jobs (
+                    job_id TEXT PRIMARY KEY,
+                    status TEXT NOT NULL,
+                    result INTEGER,
+                    error TEXT,
+                    date_created TIMESTAMP NOT NULL,
+                    date_updated TIMESTAMP NOT NULL
+                )
+            ''')
+
+            self._migrate(conn)
+            self._create_indexes(conn)
+            # One full-text index, since each copies every document's text:
+            # stemmed word search, or trigrams where that cannot be built
+            if self._create_search_index(conn, 'documents_fts', 'porter unicode61'):
+                self._drop_search_index(conn, 'documents_tri')
+            else:
+                self._create_search_index(conn, 'documents_tri', 'trigram')
+            self._create_keyword_index(conn)
+
+    def _migrate(self, conn: sqlite3.Connection):
+        """Bring rows written by older versions up to SCHEMA_VERSION"""
+        version = conn.execute('PRAGMA user_version').fetchone()[0]
+        if version >= self.SCHEMA_VERSION:
+            return
+
+        if version < 1:
+            # Dedupe keys moved from SHA-256 to BLAKE2b; rebuild them from the
+            # same fields the scrapers hash so existing rows still match
+            conn.create_function('fingerprint', 1, _fingerprint, deterministic=True)
+            conn.execute('''
+                UPDATE documents SET file_hash = CASE document_type
+                    WHEN 'tabled_paper' THEN fingerprint(
+                        title || IFNULL(chamber, 'None') || IFNULL(date_published, 'None'))
+                    WHEN 'bill' THEN fingerprint(title)
+                    WHEN 'committee_report' THEN fingerprint(
+                        IFNULL(committee, 'None') || IFNULL(description, 'None'))
+                END
+                WHERE document_type IN ('tabled_paper', 'bill', 'committee_report')
+            ''')
+
+        conn.execute(f'PRAGMA user_version = {self.SCHEMA_VERSION}')
+
+    def _create_indexes(self, conn: sqlite3.Connection):
+        """Create any missing indexes and refresh planner statistics"""
+        existing = {
+            row[0] for row in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index'"
+            )
+        }
+        missing = [name for name in self.INDEXES if name not in existing]
+        for name in missing:
+            conn.execute(f'CREATE INDEX IF NOT EXISTS {name} ON {self.INDEXES[name]}')
+
+        if missing:
+            # Let the query planner pick up the new indexes
+            conn.execute('ANALYZE')
+
+    def _create_search_index(self, conn: sqlite3.Connection, name: str, tokenize: str) -> bool:
+        """Create an FTS5 index over document text and keep it in sync via triggers,
+        returning whether the index exists"""
+        if conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = ?", (name,)
+        ).fetchone():
+            return True
+
+        try:
+            conn.execute(f'''
+                CREATE VIRTUAL TABLE {name} USING fts5(
+                    title, description, content_text,
+                    content='documents',
+                    content_rowid='id',
+                    tokenize='{tokenize}'
+                )
+            ''')
+        except sqlite3.OperationalError as e:
+            logging.warning(f"Search index {name} unavailable: {e}")
+            return False
+
+        conn.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS {name}_insert AFTER INSERT ON documents
+            BEGIN
+                INSERT INTO {name} (rowid, title, description, content_text)
+                VALUES (new.id, new.title, new.description, new.content_text);
+            END
+        ''')
+
+        conn.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS {name}_delete AFTER DELETE ON documents
+            BEGIN
+                INSERT INTO {name} ({name}, rowid, title, description, content_text)
+                VALUES ('delete', old.id, old.title, old.description, old.content_text);
+            END
+        ''')
+
+        conn.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS {name}_update
+            AFTER UPDATE OF title, description, content_text ON documents
+            BEGIN
+                INSERT INTO {name} ({name}, rowid, title, description, content_text)
+                VALUES ('delete', old.id, old.title, old.description, old.content_text);
+                INSERT INTO {name} (rowid, title, description, content_text)
+                VALUES (new.id, new.title, new.description, new.content_text);
+            END
+        ''')
+
+        # Index documents stored before the search table existed
+        conn.execute(f"INSERT INTO {name} ({name}) VALUES ('rebuild')")
+        return True
+
+    def _drop_search_index(self, conn: sqlite3.Connection, name: str):
+        """Remove a search index and the triggers that keep it in sync"""
+        for action in ('insert', 'delete', 'update'):
+            conn.execute(f'DROP TRIGGER IF EXISTS {name}_{action}')
+        conn.execute(f'DROP TABLE IF EXISTS {name}')
+
+    def _create_keyword_index(self, conn: sqlite3.Connection):
+        """Mirror each document's keyword array into document_keywords via triggers"""
+        if conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'document_keywords'"
+        ).fetchone():
+            return
+
+        conn.execute('''
+            CREATE TABLE document_keywords (
+                document_id INTEGER NOT NULL,
+                keyword TEXT NOT NULL,
+                PRIMARY KEY (document_id, keyword)
+            ) WITHOUT ROWID
+        ''')
+        conn.execute('CREATE INDEX idx_dk_kw ON document_keywords(keyword)')
+
+        conn.execute('''
+            CREATE TRIGGER IF NOT EXISTS document_keywords_insert AFTER INSERT ON documents
+            WHEN json_valid(new.keywords_found)
+            BEGIN
+                INSERT OR IGNORE INTO document_keywords (document_id, keyword)
+                SELECT new.id, value FROM json_each(new.keywords_found);
+            END
+        ''')
+
+        conn.execute('''
+            CREATE TRIGGER IF NOT EXISTS document_keywords_delete AFTER DELETE ON documents
+            BEGIN
+                DELETE FROM document_keywords WHERE document_id = old.id;
+            END
+        ''')
+
+        conn.execute('''
+            CREATE TRIGGER IF NOT EXISTS document_keywords_update
+            AFTER UPDATE OF keywords_found ON documents
+            BEGIN
+                DELETE FROM document_keywords WHERE document_id = old.id;
+                INSERT OR IGNORE INTO document_keywords (document_id, keyword)
+                SELECT new.id, value FROM json_each(new.keywords_found)
+                WHERE json_valid(new.keywords_found);
+            END
+        ''')
+
+        # Backfill keywords of documents stored before the table existed
+        conn.execute('''
+            INSERT OR IGNORE INTO document_keywords (document_id, keyword)
+            SELECT d.id, je.value
+            FROM documents d, json_each(d.keywords_found) je
+            WHERE json_valid(d.keywords_found)
+        ''')
     
+    @staticmethod
+    def _document_row(doc: Document) -> Tuple:
+        """Build the INSERT_DOCUMENT parameters for a document"""
+        return (
+            doc.source_url, doc.document_url, doc.title, doc.description,
+            doc.document_type.value, doc.chamber, doc.date_published,
+            doc.date_discovered, doc.member, doc.committee, doc.portfolio,
+            doc.file_hash, doc.content_text,
+            json.dumps(doc.keywords_found) if doc.keywords_found else None,
+            doc.alert_level.value,
+            doc.processed
+        )
+
     def save_document(self, doc: Document) -> Optional[int]:
         """Save document to database"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.execute('''
-                    INSERT OR IGNORE INTO documents (
-                        source_url, document_url, title, description,
-                        document_type, chamber, date_published, date_discovered,
-                        member, committee, portfolio, file_hash, content_text,
-                        keywords_found, alert_level, processed
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    doc.source_url, doc.document_url, doc.title, doc.description,
-                    doc.document_type.value, doc.chamber, doc.date_published,
-                    doc.date_discovered, doc.member, doc.committee, doc.portfolio,
-                    doc.file_hash, doc.content_text,
-                    json.dumps(doc.keywords_found), doc.alert_level.value,
-                    doc.processed
-                ))
-                return cursor.lastrowid
+            with self.lock:
+                cursor = self.conn.execute(self.INSERT_DOCUMENT, self._document_row(doc))
+                # lastrowid is stale when the row was ignored as a duplicate
+                return cursor.lastrowid if cursor.rowcount else None
         except sqlite3.Error as e:
             logging.error(f"Database error saving document: {e}")
             return None
+
+    def save_documents(self, docs: List[Document]) -> Optional[List[Optional[int]]]:
+        """Save documents in one transaction, returning each new row id (None if
+        ignored), or None if the transaction failed"""
+        if not docs:
+            return []
+        try:
+            with self.transaction() as conn:
+                last_id = conn.execute('SELECT COALESCE(MAX(id), 0) FROM documents').fetchone()[0]
+                conn.executemany(
+                    self.INSERT_DOCUMENT, [self._document_row(doc) for doc in docs]
+                )
+                # Only rows inserted by this batch sit above the previous maximum
+                new_ids = dict(conn.execute(
+                    'SELECT file_hash, id FROM documents WHERE id > ?', (last_id,)
+                ).fetchall())
+        except sqlite3.Error as e:
+            logging.error(f"Database error saving documents: {e}")
+            return None
+        
+        ids = []
+        for doc in docs:
+            # A repeated hash was ignored by the insert; credit only its first row
+            ids.append(new_ids.pop(doc.file_hash, None))
+        return ids
+    
+    def iter_unprocessed_documents(self) -> Iterator[Document]:
+        """Yield documents that haven't been processed, a batch of rows at a time"""
+        with self.lock:
+            cursor = self.conn.execute('''
+                SELECT id, source_url, document_url, title, description,
+                       document_type, chamber, date_published, date_discovered,
+                       member, committee, portfolio, file_hash, content_text,
+                       keywords_found, alert_level, processed
+                FROM documents WHERE processed = FALSE
+            ''')
+            cursor.row_factory = None
+        
+        # The lock is only held while stepping the cursor, never across a yield
+        while True:
+            with self.lock:
+                rows = cursor.fetchmany(self.FETCH_BATCH_SIZE)
+            if not rows:
+                break
+            for row in rows:
+                yield self._unprocessed_document(row)
+    
+    @staticmethod
+    def _unprocessed_document(row: Tuple) -> Document:
+        """Build a Document from an iter_unprocessed_documents row"""
+        (doc_id, source_url, document_url, title, description,
+         document_type, chamber, date_published, date_discovered,
+         member, committee, portfolio, file_hash, content_text,
+         keywords_found, alert_level, processed) = row
+        return Document(
+            id=doc_id,
+            source_url=source_url,
+            document_url=document_url,
+            title=title,
+            description=description,
+            document_type=_DOC_TYPE_BY_VALUE[document_type],
+            chamber=chamber,
+            date_published=date_published,
+            date_discovered=date_discovered,
+            member=member,
+            committee=committee,
+            portfolio=portfolio,
+            file_hash=file_hash,
+            content_text=content_text,
+            keywords_found=json.loads(keywords_found) if keywords_found else [],
+            alert_level=_ALERT_LEVEL_BY_VALUE[alert_level],
+            processed=bool(processed)
+        )
     
     def get_unprocessed_documents(self) -> List[Document]:
         """Get documents that haven't been processed"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            rows = conn.execute('''
-                SELECT * FROM documents WHERE processed = FALSE
-            ''').fetchall()
-            
-            documents = []
-            for row in rows:
-                doc = Document(
-                    id=row['id'],
-                    source_url=row['source_url'],
-                    document_url=row['document_url'],
-                    title=row['title'],
-                    description=row['description'],
-                    document_type=DocumentType(row['document_type']),
-                    chamber=row['chamber'],
-                    date_published=row['date_published'],
-                    date_discovered=row['date_discovered'],
-                    member=row['member'],
-                    committee=row['committee'],
-                    portfolio=row['portfolio'],
-                    file_hash=row['file_hash'],
-                    content_text=row['content_text'],
-                    keywords_found=json.loads(row['keywords_found'] or '[]'),
-                    alert_level=AlertLevel(row['alert_level']),
-                    processed=bool(row['processed'])
-                )
-                documents.append(doc)
-            
-            return documents
+        return list(self.iter_unprocessed_documents())
     
     def mark_processed(self, doc_id: int):
         """Mark document as processed"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute(
+        with self.lock:
+            self.conn.execute(
                 'UPDATE documents SET processed = TRUE WHERE id = ?',
                 (doc_id,)
             )
     
     def document_exists(self, file_hash: str) -> bool:
         """Check if document already exists by hash"""
-        with sqlite3.connect(self.db_path) as conn:
-            result = conn.execute(
-                'SELECT COUNT(*) FROM documents WHERE file_hash = ?',
+        with self.lock:
+            result = self.conn.execute(
+                'SELECT 1 FROM documents WHERE file_hash = ? LIMIT 1',
                 (file_hash,)
             ).fetchone()
-            return result[0] > 0
+        return result is not None
+
+    def existing_hashes(self, hashes: List[str]) -> Set[str]:
+        """Return the subset of hashes that are already stored"""
+        unique = list(dict.fromkeys(h for h in hashes if h))
+        found = set()
+        for start in range(0, len(unique), self.MAX_SQL_VARIABLES):
+            batch = unique[start:start + self.MAX_SQL_VARIABLES]
+            placeholders = ','.join('?' * len(batch))
+            with self.lock:
+                rows = self.conn.execute(
+                    f'SELECT file_hash FROM documents WHERE file_hash IN ({placeholders})',
+                    batch
+                ).fetchall()
+            found.update(row[0] for row in rows)
+        return found
+
+    def fetch_dicts(self, query: str, params: Tuple = ()) -> List[Dict]:
+        """Run a query and return its rows as dicts, reading column names once"""
+        with self.lock:
+            cursor = self.conn.cursor()
+            cursor.row_factory = None
+            rows = cursor.execute(query, params).fetchall()
+        columns = [column[0] for column in cursor.description]
+        return [dict(zip(columns, row)) for row in rows]
+
+    def start_sync_job(self, job_id: str) -> Tuple[str, str]:
+        """Queue a sync job unless one is already active, returning the id and
+        status of the job that will run"""
+        now = datetime.now()
+        with self.transaction() as conn:
+            conn.execute(
+                "DELETE FROM sync_jobs WHERE status IN ('complete', 'failed') AND date_updated < ?",
+                (now - self.SYNC_JOB_RETENTION,)
+            )
+            conn.execute('''
+                UPDATE sync_jobs SET status = 'failed', error = 'Abandoned by its worker', date_updated = ?
+                WHERE status IN ('queued', 'running') AND date_updated < ?
+            ''', (now, now - self.SYNC_JOB_TIMEOUT))
+            
+            # One cycle at a time across every process sharing the database
+            active = conn.execute(
+                "SELECT job_id, status FROM sync_jobs WHERE status IN ('queued', 'running')"
+            ).fetchone()
+            if active:
+                return active['job_id'], active['status']
+            
+            conn.execute('''
+                INSERT INTO sync_jobs (job_id, status, date_created, date_updated)
+                VALUES (?, 'queued', ?, ?)
+            ''', (job_id, now, now))
+        return job_id, 'queued'
+    
+    def update_sync_job(self, job_id: str, status: str, result: Optional[int] = None,
+                        error: Optional[str] = None):
+        """Record a sync job's progress"""
+        with self.transaction() as conn:
+            conn.execute('''
+                UPDATE sync_jobs SET status = ?, result = ?, error = ?, date_updated = ?
+                WHERE job_id = ?
+            ''', (status, result, error, datetime.now(), job_id))
+
+    def get_url_cache(self) -> PageCache:
+        """Load the stored conditional GET validators for listing pages"""
+        with self.lock:
+            rows = self.conn.execute(
+                'SELECT url, etag, last_modified, body_hash FROM url_cache'
+            ).fetchall()
+        return PageCache({url: (etag, last_modified, body_hash)
+                          for url, etag, last_modified, body_hash in rows})
+
+    def save_url_cache(self, cache: PageCache):
+        """Store the validators of pages fetched since the cache was loaded"""
+        fresh = cache.fresh_entries()
+        if not fresh:
+            return
+        now = datetime.now()
+        try:
+            with self.transaction() as conn:
+                conn.executemany('''
+                    INSERT OR REPLACE INTO url_cache (url, etag, last_modified, body_hash, fetched_at)
+                    VALUES (?, ?, ?, ?, ?)
+                ''', [(url, etag, last_modified, body_hash, now)
+                      for url, (etag, last_modified, body_hash) in fresh.items()])
+        except sqlite3.Error as e:
+            logging.error(f"Database error saving URL cache: {e}")
 
 
 class WebScraper:
     """Handles web scraping operations"""
 
+    # PDFs up to this size are held in memory while text is extracted
+    PDF_SPOOL_SIZE = 8 * 1024 * 1024
+    # Larger downloads are abandoned rather than stalling the cycle
+    PDF_MAX_SIZE = 50 * 1024 * 1024
+
     def __init__(self, config: Config):
         self.config = config
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': self.config.USER_AGENT
         })
+        # Every source lives on a handful of hosts, so keep their
+        # connections alive and let concurrent fetches share the pool;
+        # retries are handled by fetch_page
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=4, pool_maxsize=16, max_retries=0
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
     
-    def fetch_page(self, url: str, retry_count: int = 0) -> Optional[str]:
-        """Fetch webpage content with retry logic"""
-        try:
-            response = self.session.get(url, timeout=self.config.REQUEST_TIMEOUT)
-            response.raise_for_status()
-            return response.text
-        except requests.RequestException as e:
-            logging.error(f"Error fetching {url}: {e}")
-            if retry_count < self.config.RETRY_ATTEMPTS:
-                time.sleep(self.config.RETRY_DELAY)
-                return self.fetch_page(url, retry_count + 1)
-            return None
+    def close(self):
+        """Release pooled HTTP connections"""
+        self.session.close()
+    
+    def _backoff(self, attempt: int):
+        """Sleep before retry number attempt + 1, with jitter so retries don't align"""
+        time.sleep(self.config.RETRY_DELAY * 2 ** attempt + random.random())
 
-    def fetch_pdf(self, url: str) -> Optional[bytes]:
-        """Fetch PDF content"""
-        try:
-            response = self.session.get(url, timeout=self.config.REQUEST_TIMEOUT)
-            response.raise_for_status()
-            if 'application/pdf' in response.headers.get('Content-Type', ''):
-                return response.content
+    def fetch_response(self, url: str, headers: Optional[Dict[str, str]] = None):
+        """GET a URL, retrying with exponential backoff; a 304 counts as success"""
+        for attempt in range(self.config.RETRY_ATTEMPTS + 1):
+            try:
+                response = self.session.get(
+                    url, timeout=self.config.REQUEST_TIMEOUT, headers=headers
+                )
+                response.raise_for_status()
+                return response
+            except requests.RequestException as e:
+                logging.error(f"Error fetching {url}: {e}")
+                if attempt < self.config.RETRY_ATTEMPTS:
+                    self._backoff(attempt)
+        return None
+
+    def fetch_page(self, url: str) -> Optional[str]:
+        """Fetch webpage content, retrying with exponential backoff"""
+        response = self.fetch_response(url)
+        return response.text if response is not None else None
+
+    def fetch_listing(self, url: str, cache: Optional[PageCache] = None) -> Optional[str]:
+        """Fetch a listing page, or None if it failed or is unchanged since the cached copy"""
+        if cache is None:
+            return self.fetch_page(url)
+
+        response = self.fetch_response(url, cache.request_headers(url))
+        if response is None:
             return None
-        except requests.RequestException as e:
-            logging.error(f"Error fetching PDF {url}: {e}")
+        if response.status_code == 304:
+            logging.info(f"Unchanged since last cycle: {url}")
+            return None
+
+        html = response.text
+        body_hash = _fingerprint(html)
+        # Some servers ignore conditional headers; compare the body as well
+        if cache.is_unchanged(url, body_hash):
+            logging.info(f"Unchanged since last cycle: {url}")
             return None
+        cache.record(
+            url,
+            response.headers.get('ETag'),
+            response.headers.get('Last-Modified'),
+            body_hash
+        )
+        return html
+
+    def fetch_and_extract_pdf(self, url: str) -> Optional[str]:
+        """Download a PDF and extract its text without buffering it as bytes"""
+        for attempt in range(self.config.RETRY_ATTEMPTS + 1):
+            try:
+                with self.session.get(
+                    url,
+                    timeout=self.config.REQUEST_TIMEOUT,
+                    headers={'Accept': 'application/pdf'},
+                    stream=True
+                ) as response:
+                    response.raise_for_status()
+                    if 'application/pdf' not in response.headers.get('Content-Type', ''):
+                        return None
+                    length = response.headers.get('Content-Length', '')
+                    if length.isdigit() and int(length) > self.PDF_MAX_SIZE:
+                        logging.warning(f"Skipping oversized PDF {url}")
+                        return None
+
+                    # pdfplumber needs a seekable file; large PDFs spill to disk
+                    with tempfile.SpooledTemporaryFile(max_size=self.PDF_SPOOL_SIZE) as pdf_file:
+                        for chunk in response.iter_content(chunk_size=64 * 1024):
+                            pdf_file.write(chunk)
+                            # Content-Length may be missing or wrong
+                            if pdf_file.tell() > self.PDF_MAX_SIZE:
+                                logging.warning(f"Skipping oversized PDF {url}")
+                                return None
+                        pdf_file.seek(0)
+                        return self.extract_pdf_text(pdf_file)
+            except requests.RequestException as e:
+                logging.error(f"Error fetching PDF {url}: {e}")
+                if attempt < self.config.RETRY_ATTEMPTS:
+                    self._backoff(attempt)
+        return None
+    
+    def iter_pdf_text(self, pdf_file: BinaryIO) -> Iterator[str]:
+        """Yield the text of each page in a PDF file object"""
+        with pdfplumber.open(pdf_file) as pdf:
+            for page in pdf.pages:
+                yield page.extract_text() or ''
+                # Release the page's parsed layout before moving to the next
+                page.flush_cache()
     
-    def extract_pdf_text(self, pdf_content: bytes) -> Optional[str]:
-        """Extract text from PDF content"""
+    def extract_pdf_text(self, pdf_file: BinaryIO) -> Optional[str]:
+        """Extract text from a PDF file object"""
         try:
-            import io
-            with pdfplumber.open(io.BytesIO(pdf_content)) as pdf:
-                text = ''
-                for page in pdf.pages:
-                    text += page.extract_text() + '\n'
-                return text
+            return ''.join(text + '\n' for text in self.iter_pdf_text(pdf_file))
         except Exception as e:
             logging.error(f"Error extracting PDF text: {e}")
             return None
 
 
+# Static parts of the alert email, built once at import
+_HTML_HEAD = """
+<html>
+<body style="font-family: Arial, sans-serif;">
+    <h2 style="color: #004d3d;">Tasmania Parliament Monitor Alert</h2>
+"""
+_HTML_FOOT = """
+    <hr>
+    <p style="color: #666;">
+        <small>
+        This is an automated alert from Tasmania Parliament Monitor.<br>
+        To modify alert settings, please update your configuration.
+        </small>
+    </p>
+</body>
+</html>
+"""
+_SECTION_HEADINGS = {
+    'critical': '<h3 style="color: red;">🚨 CRITICAL ALERTS</h3>',
+    'high': '<h3 style="color: orange;">⚠️ HIGH PRIORITY</h3>',
+    'standard': '<h3 style="color: blue;">📋 STANDARD UPDATES</h3>',
+}
+_LEVEL_COLOR = {'critical': 'red', 'high': 'orange', 'standard': 'blue'}
+# One alert block; every substituted field is HTML-escaped by the caller
+_ALERT_TEMPLATE = """
+        <div style="margin: 20px 0; padding: 15px; border-left: 4px solid %s;">
+            <h4 style="margin: 0 0 10px 0;">%s</h4>
+            <p style="color: #666; margin: 5px 0;">
+                %s
+            </p>
+            <p style="margin: 5px 0;">
+                <strong>Type:</strong> %s<br>
+                <strong>Chamber:</strong> %s<br>
+                <strong>Keywords:</strong> %s
+            </p>
+            <p style="margin: 10px 0 0 0;">
+                <a href="%s" style="color: #004d3d;">View Document →</a>
+            </p>
+        </div>
+"""
+
+
 class ParliamentMonitor:
     """Main monitoring service"""
 
+    # Documents analysed in parallel per cycle
+    ANALYSIS_WORKERS = 8
+
     def __init__(self, config: Optional[Config] = None):
         self.config = config or refresh_runtime_config()
         self.db = DatabaseManager(self.config.DB_PATH)
         self.scraper = WebScraper(self.config)
+        self._smtp: Optional[smtplib.SMTP] = None
         self.setup_logging()
     
+    def close(self):
+        """Release the SMTP session, HTTP pool and database connection"""
+        self.close_smtp()
+        self.scraper.close()
+        self.db.close()
+    
     def setup_logging(self):
         """Configure logging"""
         logging.basicConfig(
@@ -385,52 +1100,29 @@ class ParliamentMonitor:
             ]
         )
     
-    def scrape_tabled_papers(self, url: str, chamber: str) -> List[Document]:
+    def scrape_tabled_papers(self, url: str, chamber: str,
+                             cache: Optional[PageCache] = None) -> List[Document]:
         """Scrape tabled papers from a chamber page"""
         documents = []
         if not url:
             logging.warning(f"No tabled paper URL configured for {chamber}")
             return documents
 
-        html = self.scraper.fetch_page(url)
+        html = self.scraper.fetch_listing(url, cache)
         
         if not html:
             return documents
         
-        soup = BeautifulSoup(html, 'html.parser')
-        
-        # Look for paper listings (adapt selectors based on actual HTML structure)
-        papers = soup.find_all(['tr', 'div', 'li'], class_=re.compile(
-            r'(paper|document|tabled)', re.I
-        ))
-        
-        for paper in papers:
+        for title, link, date_text in _iter_paper_listings(html):
             try:
-                # Extract title
-                title_elem = paper.find(['a', 'span'], class_=re.compile(r'title', re.I))
-                if not title_elem:
-                    title_elem = paper.find('a')
-                
-                if not title_elem:
-                    continue
-                
-                title = title_elem.get_text(strip=True)
-                
                 # Extract link
-                link = None
-                if title_elem.name == 'a':
-                    link = title_elem.get('href')
-                    if link and not link.startswith('http'):
-                        link = f"https://www.parliament.tas.gov.au{link}"
+                if link and not link.startswith('http'):
+                    link = f"https://www.parliament.tas.gov.au{link}"
                 
-                # Extract date
-                date_text = paper.find(text=re.compile(r'\d{1,2}[\s/]\w+[\s/]\d{4}'))
-                date_published = None
-                if date_text:
-                    try:
-                        date_published = datetime.strptime(date_text, '%d %B %Y')
-                    except:
-                        pass
+                # Only a text node holding nothing but the date is parsed;
+                # stored hashes depend on rows like "Tabled 12 March 2025"
+                # keeping no date
+                date_published = _parse_date(date_text) if date_text else None
                 
                 # Create document
                 doc = Document(
@@ -443,8 +1135,7 @@ class ParliamentMonitor:
                 )
                 
                 # Generate hash
-                hash_content = f"{title}{chamber}{date_published}"
-                doc.file_hash = hashlib.sha256(hash_content.encode()).hexdigest()
+                doc.file_hash = _fingerprint(f"{title}{chamber}{date_published}")
                 
                 documents.append(doc)
                 
@@ -454,22 +1145,22 @@ class ParliamentMonitor:
         logging.info(f"Found {len(documents)} papers from {chamber}")
         return documents
     
-    def scrape_bills(self) -> List[Document]:
+    def scrape_bills(self, cache: Optional[PageCache] = None) -> List[Document]:
         """Scrape current bills"""
         documents = []
         url = self.config.URLS.get('bills')
         if not url:
             logging.warning("Bills URL missing from configuration")
             return documents
-        html = self.scraper.fetch_page(url)
+        html = self.scraper.fetch_listing(url, cache)
         
         if not html:
             return documents
         
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, HTML_PARSER, parse_only=_BILL_STRAINER)
         
         # Look for bill listings
-        bills = soup.find_all(['tr', 'div'], class_=re.compile(r'bill', re.I))
+        bills = soup.find_all(['tr', 'div'], class_=_BILL_CLASS_RE)
         
         for bill in bills:
             try:
@@ -484,9 +1175,7 @@ class ParliamentMonitor:
                     link = f"https://www.parliament.tas.gov.au{link}"
                 
                 # Extract status
-                status = bill.find(text=re.compile(
-                    r'(first|second|third) reading|royal assent', re.I
-                ))
+                status = bill.find(text=_READING_RE)
                 
                 doc = Document(
                     source_url=url,
@@ -496,7 +1185,7 @@ class ParliamentMonitor:
                     document_type=DocumentType.BILL
                 )
                 
-                doc.file_hash = hashlib.sha256(title.encode()).hexdigest()
+                doc.file_hash = _fingerprint(title)
                 documents.append(doc)
                 
             except Exception as e:
@@ -505,24 +1194,25 @@ class ParliamentMonitor:
         logging.info(f"Found {len(documents)} bills")
         return documents
     
-    def scrape_committees(self) -> List[Document]:
+    def scrape_committees(self, cache: Optional[PageCache] = None) -> List[Document]:
         """Scrape committee information"""
         documents = []
+        committee_urls = [url for key, url in self.config.URLS.items() if 'committee' in key]
         
-        for key, url in self.config.URLS.items():
-            if 'committee' not in key:
-                continue
-            
-            html = self.scraper.fetch_page(url)
+        # Fetch the pages concurrently; parsing below stays sequential
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            pages = list(executor.map(
+                lambda url: self.scraper.fetch_listing(url, cache), committee_urls
+            ))
+        
+        for url, html in zip(committee_urls, pages):
             if not html:
                 continue
             
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = BeautifulSoup(html, HTML_PARSER, parse_only=_COMMITTEE_STRAINER)
             
             # Look for committee information
-            committees = soup.find_all(['div', 'section'], class_=re.compile(
-                r'committee', re.I
-            ))
+            committees = soup.find_all(['div', 'section'], class_=_COMMITTEE_CLASS_RE)
             
             for committee in committees:
                 try:
@@ -532,8 +1222,12 @@ class ParliamentMonitor:
                     
                     name = name_elem.get_text(strip=True)
                     
-                    # Look for inquiry information
-                    inquiry = committee.find(text=re.compile(r'inquiry|submission', re.I))
+                    # Look for inquiry information, skipping the per-node
+                    # search when the block never mentions one
+                    block_text = committee.get_text().lower()
+                    if 'inquiry' not in block_text and 'submission' not in block_text:
+                        continue
+                    inquiry = committee.find(text=_INQUIRY_RE)
                     
                     if inquiry:
                         doc = Document(
@@ -544,9 +1238,7 @@ class ParliamentMonitor:
                             committee=name
                         )
                         
-                        doc.file_hash = hashlib.sha256(
-                            f"{name}{inquiry}".encode()
-                        ).hexdigest()
+                        doc.file_hash = _fingerprint(f"{name}{inquiry}")
                         
                         documents.append(doc)
                         
@@ -561,25 +1253,20 @@ class ParliamentMonitor:
         if not doc.content_text:
             # Try to fetch and extract content if we have a PDF URL
             if doc.document_url and doc.document_url.endswith('.pdf'):
-                pdf_content = self.scraper.fetch_pdf(doc.document_url)
-                if pdf_content:
-                    doc.content_text = self.scraper.extract_pdf_text(pdf_content)
+                doc.content_text = self.scraper.fetch_and_extract_pdf(doc.document_url)
         
-        # Search for keywords
-        text_to_search = f"{doc.title} {doc.description or ''} {doc.content_text or ''}"
-        text_lower = text_to_search.lower()
+        # Search for keywords; only the lowercased copy of the combined
+        # text is kept, so a large PDF body is held twice only briefly
+        text_lower = f"{doc.title} {doc.description or ''} {doc.content_text or ''}".lower()
         
-        keywords_found = []
-        for keyword in self.config.ALERT_KEYWORDS:
-            if keyword.lower() in text_lower:
-                keywords_found.append(keyword)
+        keywords_found = self.config.ALERT_MATCHER.find(text_lower)
         
         doc.keywords_found = keywords_found
         
         # Determine alert level
-        if any(kw.lower() in text_lower for kw in self.config.CRITICAL_KEYWORDS):
+        if self.config.CRITICAL_MATCHER.search(text_lower):
             doc.alert_level = AlertLevel.CRITICAL
-        elif any(source.lower() in text_lower for source in self.config.HIGH_PRIORITY_SOURCES):
+        elif self.config.SOURCE_MATCHER.search(text_lower):
             doc.alert_level = AlertLevel.HIGH
         elif len(keywords_found) > 3:
             doc.alert_level = AlertLevel.HIGH
@@ -590,22 +1277,21 @@ class ParliamentMonitor:
         
         return doc
     
-    def create_alert(self, doc: Document) -> Dict:
+    def create_alert(self, doc: Document) -> Alert:
         """Create alert from document"""
-        alert = {
-            'document_id': doc.id,
-            'alert_level': doc.alert_level.value,
-            'title': doc.title,
-            'description': doc.description,
-            'keywords_matched': ', '.join(doc.keywords_found),
-            'date_created': datetime.now(),
-            'chamber': doc.chamber,
-            'document_type': doc.document_type.value,
-            'url': doc.document_url or doc.source_url
-        }
-        return alert
+        return Alert(
+            document_id=doc.id,
+            alert_level=doc.alert_level.value,
+            title=doc.title,
+            description=doc.description,
+            keywords_matched=', '.join(doc.keywords_found),
+            date_created=datetime.now(),
+            chamber=doc.chamber,
+            document_type=doc.document_type.value,
+            url=doc.document_url or doc.source_url
+        )
     
-    def send_email_alert(self, alerts: List[Dict]):
+    def send_email_alert(self, alerts: List[Alert]):
         """Send email alerts"""
         if not self.config.EMAIL_ENABLED:
             logging.info("Email alerts disabled")
@@ -613,38 +1299,21 @@ class ParliamentMonitor:
         
         try:
             # Group alerts by level
-            critical = [a for a in alerts if a['alert_level'] == 'critical']
-            high = [a for a in alerts if a['alert_level'] == 'high']
-            standard = [a for a in alerts if a['alert_level'] == 'standard']
+            critical = [a for a in alerts if a.alert_level == 'critical']
+            high = [a for a in alerts if a.alert_level == 'high']
+            standard = [a for a in alerts if a.alert_level == 'standard']
             
             # Build email content
             subject = f"Parliament Monitor Alert - {len(critical)} Critical, {len(high)} High Priority"
             
-            html_content = f"""
-            <html>
-            <body style="font-family: Arial, sans-serif;">
-                <h2 style="color: #004d3d;">Tasmania Parliament Monitor Alert</h2>
-                <p>Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}</p>
-                
-                {'<h3 style="color: red;">🚨 CRITICAL ALERTS</h3>' if critical else ''}
-                {''.join(self._format_alert_html(a) for a in critical)}
-                
-                {'<h3 style="color: orange;">⚠️ HIGH PRIORITY</h3>' if high else ''}
-                {''.join(self._format_alert_html(a) for a in high)}
-                
-                {'<h3 style="color: blue;">📋 STANDARD UPDATES</h3>' if standard else ''}
-                {''.join(self._format_alert_html(a) for a in standard)}
-                
-                <hr>
-                <p style="color: #666;">
-                    <small>
-                    This is an automated alert from Tasmania Parliament Monitor.<br>
-                    To modify alert settings, please update your configuration.
-                    </small>
-                </p>
-            </body>
-            </html>
-            """
+            generated = datetime.now().strftime('%Y-%m-%d %H:%M')
+            parts = [_HTML_HEAD, f"<p>Generated: {generated}</p>"]
+            for level, group in (('critical', critical), ('high', high), ('standard', standard)):
+                if group:
+                    parts.append(_SECTION_HEADINGS[level])
+                    parts.extend(self._format_alert_html(a) for a in group)
+            parts.append(_HTML_FOOT)
+            html_content = ''.join(parts)
             
             # Send email
             msg = MIMEMultipart('alternative')
@@ -654,78 +1323,116 @@ class ParliamentMonitor:
 
             msg.attach(MIMEText(html_content, 'html'))
 
-            with smtplib.SMTP(self.config.SMTP_SERVER, self.config.SMTP_PORT) as server:
-                server.starttls()
-                server.login(self.config.EMAIL_FROM, self.config.EMAIL_PASSWORD)
-                server.send_message(msg)
+            try:
+                self._get_smtp().send_message(msg)
+            except smtplib.SMTPServerDisconnected:
+                # Dropped between the health check and the send; reconnect once
+                self._smtp = None
+                self._get_smtp().send_message(msg)
             
             logging.info(f"Email alert sent with {len(alerts)} items")
             
         except Exception as e:
             logging.error(f"Failed to send email: {e}")
     
-    def _format_alert_html(self, alert: Dict) -> str:
+    def _get_smtp(self) -> smtplib.SMTP:
+        """Return a logged-in SMTP session, reconnecting if the cached one went stale"""
+        if self._smtp is not None:
+            try:
+                if self._smtp.noop()[0] == 250:
+                    return self._smtp
+            except (smtplib.SMTPException, OSError):
+                pass
+            self.close_smtp()
+        
+        server = smtplib.SMTP(self.config.SMTP_SERVER, self.config.SMTP_PORT)
+        try:
+            server.starttls()
+            server.login(self.config.EMAIL_FROM, self.config.EMAIL_PASSWORD)
+        except Exception:
+            server.close()
+            raise
+        self._smtp = server
+        return server
+    
+    def close_smtp(self):
+        """Close the cached SMTP session, if any"""
+        if self._smtp is None:
+            return
+        try:
+            self._smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            self._smtp.close()
+        self._smtp = None
+    
+    def _format_alert_html(self, alert: Alert) -> str:
         """Format single alert as HTML"""
-        return f"""
-        <div style="margin: 20px 0; padding: 15px; border-left: 4px solid 
-                    {'red' if alert['alert_level'] == 'critical' else 
-                     'orange' if alert['alert_level'] == 'high' else 'blue'};">
-            <h4 style="margin: 0 0 10px 0;">{alert['title']}</h4>
-            <p style="color: #666; margin: 5px 0;">
-                {alert['description'] or 'No description available'}
-            </p>
-            <p style="margin: 5px 0;">
-                <strong>Type:</strong> {alert['document_type']}<br>
-                <strong>Chamber:</strong> {alert['chamber'] or 'N/A'}<br>
-                <strong>Keywords:</strong> {alert['keywords_matched'] or 'None'}
-            </p>
-            <p style="margin: 10px 0 0 0;">
-                <a href="{alert['url']}" style="color: #004d3d;">View Document →</a>
-            </p>
-        </div>
-        """
+        return _ALERT_TEMPLATE % (
+            _LEVEL_COLOR.get(alert.alert_level, 'blue'),
+            escape(alert.title),
+            escape(alert.description or 'No description available'),
+            escape(alert.document_type),
+            escape(alert.chamber or 'N/A'),
+            escape(alert.keywords_matched or 'None'),
+            escape(alert.url),
+        )
     
     def run_monitoring_cycle(self):
         """Run one monitoring cycle"""
         logging.info("Starting monitoring cycle...")
         
-        all_documents = []
+        # Pages unchanged since the last saved cycle are skipped unparsed
+        cache = self.db.get_url_cache()
         
-        # Scrape House of Assembly tabled papers
-        docs = self.scrape_tabled_papers(
-            self.config.URLS.get('house_tabled'),
-            'House of Assembly'
-        )
-        all_documents.extend(docs)
-
-        # Scrape Legislative Council tabled papers
-        docs = self.scrape_tabled_papers(
-            self.config.URLS.get('lc_tabled'),
-            'Legislative Council'
-        )
-        all_documents.extend(docs)
+        # The sources are independent and mostly wait on HTTP, so scrape
+        # them concurrently while keeping their results in source order
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            scrapes = [
+                executor.submit(
+                    self.scrape_tabled_papers,
+                    self.config.URLS.get('house_tabled'),
+                    'House of Assembly',
+                    cache
+                ),
+                executor.submit(
+                    self.scrape_tabled_papers,
+                    self.config.URLS.get('lc_tabled'),
+                    'Legislative Council',
+                    cache
+                ),
+                executor.submit(self.scrape_bills, cache),
+                executor.submit(self.scrape_committees, cache),
+            ]
+            all_documents = [doc for scrape in scrapes for doc in scrape.result()]
+        
+        # Process new documents; sources overlap, so keep only the first document seen per hash
+        seen = set()
+        unique_documents = []
+        for doc in all_documents:
+            if doc.file_hash not in seen:
+                seen.add(doc.file_hash)
+                unique_documents.append(doc)
         
-        # Scrape bills
-        docs = self.scrape_bills()
-        all_documents.extend(docs)
+        known = self.db.existing_hashes([doc.file_hash for doc in unique_documents])
+        candidates = [doc for doc in unique_documents if doc.file_hash not in known]
         
-        # Scrape committees
-        docs = self.scrape_committees()
-        all_documents.extend(docs)
+        # Analysis mostly waits on PDF downloads, so overlap it across documents
+        if candidates:
+            with ThreadPoolExecutor(max_workers=self.ANALYSIS_WORKERS) as executor:
+                candidates = list(executor.map(self.analyze_document, candidates))
         
-        # Process new documents
+        # Save the cycle's documents in a single transaction
         new_documents = []
-        for doc in all_documents:
-            if not self.db.document_exists(doc.file_hash):
-                # Analyze document
-                doc = self.analyze_document(doc)
-                
-                # Save to database
-                doc.id = self.db.save_document(doc)
-                
-                if doc.id and doc.keywords_found:
-                    new_documents.append(doc)
-                    logging.info(f"New document: {doc.title} [{doc.alert_level.value}]")
+        doc_ids = self.db.save_documents(candidates)
+        for doc, doc_id in zip(candidates, doc_ids or []):
+            doc.id = doc_id
+            if doc.id and doc.keywords_found:
+                new_documents.append(doc)
+                logging.info(f"New document: {doc.title} [{doc.alert_level.value}]")
+        
+        # Remember page validators only once everything they led to is stored
+        if doc_ids is not None:
+            self.db.save_url_cache(cache)
         
         # Create and send alerts for new documents
         if new_documents:
@@ -740,63 +1447,85 @@ class ParliamentMonitor:
         """Run monitoring on schedule"""
         logging.info("Starting scheduled monitoring service...")
         
-        # Schedule different checks
-        schedule.every(self.config.CHECK_FREQUENCY['tabled_papers']).minutes.do(
-            lambda: self.scrape_tabled_papers(self.config.URLS.get('house_tabled'), 'House of Assembly')
-        )
-        schedule.every(self.config.CHECK_FREQUENCY['bills']).minutes.do(
-            self.scrape_bills
-        )
-        schedule.every(self.config.CHECK_FREQUENCY['committees']).minutes.do(
-            self.scrape_committees
+        try:
+            asyncio.run(self._run_schedule())
+        finally:
+            self.close_smtp()
+    
+    async def _run_schedule(self):
+        """Run each check on its own timer until cancelled"""
+        await asyncio.gather(
+            self._every(
+                self.config.CHECK_FREQUENCY['tabled_papers'],
+                lambda: self.scrape_tabled_papers(self.config.URLS.get('house_tabled'), 'House of Assembly')
+            ),
+            self._every(self.config.CHECK_FREQUENCY['bills'], self.scrape_bills),
+            self._every(self.config.CHECK_FREQUENCY['committees'], self.scrape_committees),
+            # Run full cycle every hour
+            self._every(60, self.run_monitoring_cycle),
         )
-        
-        # Run full cycle every hour
-        schedule.every().hour.do(self.run_monitoring_cycle)
-        
-        # Keep running
+    
+    async def _every(self, minutes: float, job):
+        """Run a blocking job on a worker thread every `minutes` minutes"""
         while True:
-            schedule.run_pending()
-            time.sleep(60)  # Check every minute
+            await asyncio.sleep(minutes * 60)
+            try:
+                await asyncio.to_thread(job)
+            except Exception as e:
+                logging.error(f"Scheduled job failed: {e}")
     
     def export_to_json(self, output_file: str = 'parliament_data.json'):
         """Export database to JSON for the frontend"""
-        with sqlite3.connect(self.db.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            
+        conn = self.db.conn
+        
+        # Keep this monitor's own writes from landing between the three reads
+        with self.db.lock:
             # Get recent documents
-            documents = conn.execute('''
+            documents = self.db.fetch_dicts('''
                 SELECT * FROM documents 
                 ORDER BY date_discovered DESC 
                 LIMIT 100
-            ''').fetchall()
-            
+            ''')
+        
             # Get alerts
-            alerts = conn.execute('''
+            alerts = self.db.fetch_dicts('''
                 SELECT * FROM alerts 
                 WHERE sent = TRUE 
                 ORDER BY date_created DESC 
                 LIMIT 50
-            ''').fetchall()
-            
-            # Convert to dict
-            data = {
-                'last_updated': datetime.now().isoformat(),
-                'documents': [dict(d) for d in documents],
-                'alerts': [dict(a) for a in alerts],
-                'stats': {
-                    'total_documents': len(documents),
-                    'critical_alerts': sum(1 for a in alerts if dict(a)['alert_level'] == 'critical'),
-                    'high_alerts': sum(1 for a in alerts if dict(a)['alert_level'] == 'high'),
-                    'keywords_tracked': len(self.config.ALERT_KEYWORDS)
-                }
+            ''')
+        
+            # Count levels over the same window in SQL
+            level_counts = dict(conn.execute('''
+                SELECT alert_level, COUNT(*) FROM (
+                    SELECT alert_level FROM alerts
+                    WHERE sent = TRUE
+                    ORDER BY date_created DESC
+                    LIMIT 50
+                ) GROUP BY alert_level
+            ''').fetchall())
+        
+        # Convert to dict
+        data = {
+            'last_updated': datetime.now(timezone.utc).isoformat(),
+            'documents': documents,
+            'alerts': alerts,
+            'stats': {
+                'total_documents': len(documents),
+                'critical_alerts': level_counts.get('critical', 0),
+                'high_alerts': level_counts.get('high', 0),
+                'keywords_tracked': len(self.config.ALERT_KEYWORDS)
             }
-            
-            # Write to file
+        }
+        
+        # Write compact JSON; the file is read by code, not people
+        if orjson:
+            Path(output_file).write_bytes(orjson.dumps(data, default=str))
+        else:
             with open(output_file, 'w') as f:
-                json.dump(data, f, indent=2, default=str)
-            
-            logging.info(f"Exported data to {output_file}")
+                json.dump(data, f, separators=(',', ':'), default=str)
+        
+        logging.info(f"Exported data to {output_file}")
 
 
 def main():
@@ -815,15 +1544,18 @@ def main():
     
     monitor = ParliamentMonitor()
     
-    if args.export:
-        monitor.export_to_json()
-    elif args.once:
-        monitor.run_monitoring_cycle()
-    elif args.scheduled:
-        monitor.run_scheduled()
-    else:
-        # Default: run once
-        monitor.run_monitoring_cycle()
+    try:
+        if args.export:
+            monitor.export_to_json()
+        elif args.once:
+            monitor.run_monitoring_cycle()
+        elif args.scheduled:
+            monitor.run_scheduled()
+        else:
+            # Default: run once
+            monitor.run_monitoring_cycle()
+    finally:
+        monitor.close()
 
 
 if __name__ == '__main__':
@@ -10,6 +10,12 @@ import yagmail
 # File that records which transcripts have already been emailed
 LOG_FILE = Path("sent.log")
 
+# Patterns used for every transcript, compiled once at import
+PARAGRAPH_BREAK_RE = re.compile(r"\n\s*\n")
+SPEAKER_RE = re.compile(r"^(Mr|Ms|Mrs|Hon|Premier)\b")
+SENTENCE_END_RE = re.compile(r"(?<=[.!?])\s+")
+FILENAME_DATE_RE = re.compile(r"(\d{1,2} \w+ \d{4})")
+
 
 # --- Helpers -----------------------------------------------------------------
 
@@ -25,13 +31,13 @@ def load_keywords():
 
 def split_paragraphs(text: str):
     """Split transcript into paragraphs."""
-    return re.split(r"\n\s*\n", text)
+    return PARAGRAPH_BREAK_RE.split(text)
 
 
 def detect_speaker(paragraph: str):
     """Detect speaker name at start of paragraph."""
     first_line = paragraph.strip().split("\n", 1)[0]
-    if re.match(r"^(Mr|Ms|Mrs|Hon|Premier)\b", first_line):
+    if SPEAKER_RE.match(first_line):
         return first_line.strip()
     return None
 
@@ -40,14 +46,19 @@ def extract_matches(text: str, keywords):
     """Find keyword matches and return structured results."""
     results = []
     paragraphs = split_paragraphs(text)
+    # Compile each keyword's pattern once per transcript, not per paragraph
+    keyword_patterns = [
+        (kw, kw.lower(), re.compile(rf"\b{re.escape(kw)}\b", re.IGNORECASE))
+        for kw in keywords
+    ]
 
     for para in paragraphs:
-        for kw in keywords:
-            if re.search(rf"\b{re.escape(kw)}\b", para, re.IGNORECASE):
+        for kw, kw_lower, pattern in keyword_patterns:
+            if pattern.search(para):
                 # Extract 2–3 sentences around keyword
-                sentences = re.split(r"(?<=[.!?])\s+", para.strip())
+                sentences = SENTENCE_END_RE.split(para.strip())
                 for i, s in enumerate(sentences):
-                    if kw.lower() in s.lower():
+                    if kw_lower in s.lower():
                         start = max(0, i - 1)
                         end = min(len(sentences), i + 2)
                         snippet = " ".join(sentences[start:end])
@@ -59,7 +70,7 @@ def extract_matches(text: str, keywords):
 
 def parse_date_from_filename(filename: str):
     """Extract datetime from Hansard filename."""
-    m = re.search(r"(\d{1,2} \w+ \d{4})", filename)
+    m = FILENAME_DATE_RE.search(filename)
     if m:
         try:
             return datetime.strptime(m.group(1), "%d %B %Y")
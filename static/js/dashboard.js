@@ -511,6 +511,14 @@ function renderGeneric(data, container) {
     container.innerHTML = `<pre style="overflow:auto;background:rgba(15,23,42,0.05);padding:16px;border-radius:12px;">${JSON.stringify(data, null, 2)}</pre>`;
 }
 
+async function waitForSync(jobId, intervalMs = 2000) {
+    for (;;) {
+        const job = await fetchJson(`/api/sync/${jobId}`);
+        if (job.status === 'complete') return job;
+        await new Promise(resolve => setTimeout(resolve, intervalMs));
+    }
+}
+
 function setupSyncButton() {
     const syncButton = document.querySelector('#sync-now');
     if (!syncButton) return;
@@ -518,7 +526,8 @@ function setupSyncButton() {
         try {
             syncButton.disabled = true;
             syncButton.textContent = 'Syncing…';
-            const response = await fetchJson('/api/sync', { method: 'POST' });
+            const job = await fetchJson('/api/sync', { method: 'POST' });
+            const response = await waitForSync(job.job_id);
             setStatus(`Sync complete. ${response.new_documents} new documents detected.`, 'success');
             state.panels.forEach((_, sectionId) => loadSection(sectionId, { force: true }));
         } catch (error) {
@@ -0,0 +1,38 @@
+"""KeywordMatcher behaves the same with and without pyahocorasick."""
+import unittest
+from unittest import mock
+
+import parliament_monitor
+
+TEXT = "the gaming control amendment report on electronic gaming machines"
+
+
+def matchers(keywords):
+    """Build a matcher on each backend that is available"""
+    built = [parliament_monitor.KeywordMatcher(keywords)]
+    if parliament_monitor.ahocorasick is not None:
+        with mock.patch.object(parliament_monitor, 'ahocorasick', None):
+            built.append(parliament_monitor.KeywordMatcher(keywords))
+    return built
+
+
+class KeywordMatcherTests(unittest.TestCase):
+    def test_finds_keywords_in_list_order(self):
+        for matcher in matchers(['Report', 'casino', 'Electronic Gaming', 'gaming']):
+            self.assertEqual(matcher.find(TEXT), ['Report', 'Electronic Gaming', 'gaming'])
+            self.assertTrue(matcher.search(TEXT))
+
+    def test_blank_keywords_never_match(self):
+        for matcher in matchers(['', '   ', 'casino']):
+            self.assertEqual(matcher.keywords, ('casino',))
+            self.assertEqual(matcher.find(TEXT), [])
+            self.assertFalse(matcher.search(TEXT))
+
+    def test_only_blank_keywords(self):
+        for matcher in matchers(['', ' ']):
+            self.assertEqual(matcher.find(TEXT), [])
+            self.assertFalse(matcher.search(TEXT))
+
+
+if __name__ == '__main__':
+    unittest.main()
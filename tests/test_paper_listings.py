@@ -0,0 +1,62 @@
+"""Tabled paper listings parse the same with selectolax as with BeautifulSoup."""
+import unittest
+from unittest import mock
+
+import parliament_monitor
+
+LISTING = """
+<html><body>
+<div class="tabled-papers">
+  <table>
+    <tr class="paper-row">
+      <td><a class="paper-title" href="/doc/1.pdf">Annual Report 2024</a></td>
+      <td>12 March 2025</td>
+    </tr>
+    <tr class="paper-row">
+      <td><span class="title">Petition: Roads</span> <a href="/doc/2">view</a></td>
+      <td>Tabled 3 April 2025</td>
+    </tr>
+    <tr class="paper-row"><td>No link here</td></tr>
+  </table>
+  <ul>
+    <li class="document"><a href="https://example.org/3">Budget Paper No. 1</a></li>
+  </ul>
+</div>
+<div class="footer"><a href="/other">Other</a></div>
+</body></html>
+"""
+
+
+def parse_with_beautifulsoup(html):
+    with mock.patch.object(parliament_monitor, 'HTMLParser', None):
+        return list(parliament_monitor._iter_paper_listings(html))
+
+
+class PaperListingTests(unittest.TestCase):
+    @unittest.skipIf(parliament_monitor.HTMLParser is None, "selectolax is not installed")
+    def test_selectolax_matches_beautifulsoup(self):
+        fast = list(parliament_monitor._iter_paper_listings(LISTING))
+        self.assertTrue(fast)
+        self.assertEqual(fast, parse_with_beautifulsoup(LISTING))
+
+    def test_beautifulsoup_listing(self):
+        titles = [title for title, _, _ in parse_with_beautifulsoup(LISTING)]
+        self.assertEqual(titles, [
+            'Annual Report 2024',
+            'Annual Report 2024',
+            'Petition: Roads',
+            'Budget Paper No. 1',
+        ])
+
+    def test_only_exact_date_nodes_parse(self):
+        # Stored file hashes assume "Tabled 3 April 2025" yields no date
+        dates = [
+            date_text and parliament_monitor._parse_date(date_text)
+            for _, _, date_text in parse_with_beautifulsoup(LISTING)
+        ]
+        self.assertEqual(dates[2:], [None, None])
+        self.assertEqual(dates[1].date().isoformat(), '2025-03-12')
+
+
+if __name__ == '__main__':
+    unittest.main()